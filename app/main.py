@@ -3,13 +3,26 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from pydantic import BaseModel
 from pathlib import Path
-import os, tempfile, httpx, json, yaml
+import os, tempfile, httpx, json, yaml, asyncio
 
 from app.services.agent_creator import create_manager_with_roles
 from src.utils.normalize_output import normalize_inference_output
 
 app = FastAPI(title="Agent Orchestrator API")
 
+# One pooled keep-alive client shared by all worker-thread calls (httpx.Client is
+# thread-safe), so Supabase/Studio requests reuse TCP+TLS connections.
+_http = httpx.Client(
+    transport=httpx.HTTPTransport(
+        retries=3,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    ),
+)
+
+@app.on_event("shutdown")
+def _close_http():
+    _http.close()
+
 # -----------------------------
 # Supabase Helper
 # -----------------------------
@@ -34,7 +47,9 @@ async def fetch_user_api_key(user_id: str) -> str:
         "user_id": f"eq.{user_id}"
     }
 
-    resp = httpx.get(
+    # Blocking client call runs in a worker thread so the event loop stays free
+    resp = await asyncio.to_thread(
+        _http.get,
         f"{supabase_url}/rest/v1/user_profiles_with_decrypted_key",
         headers=headers,
         params=query,
@@ -64,7 +79,9 @@ async def create_agents_from_file(user_id: str, file: UploadFile = File(...)):
         tmp.write(await file.read())
         yaml_path = Path(tmp.name)
 
-    result = create_manager_with_roles(yaml_path, headers, base_url, log_file)
+    result = await asyncio.to_thread(
+        create_manager_with_roles, yaml_path, headers, base_url, log_file, api_key
+    )
     return {"status": "success", "created": result}
 
 # -----------------------------
@@ -91,7 +108,9 @@ async def run_inference(req: InferencePayload):
     }
 
     try:
-        resp = httpx.post(f"{base_url}/v3/inference/chat/", headers=headers, json=payload, timeout=60)
+        resp = await asyncio.to_thread(
+            _http.post, f"{base_url}/v3/inference/chat/", headers=headers, json=payload, timeout=60
+        )
         resp.raise_for_status()
 
         raw = resp.json()
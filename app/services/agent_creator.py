@@ -1,6 +1,6 @@
 from pathlib import Path
-import yaml
 from scripts.create_agent_from_yaml import create_agent_from_yaml
+from src.utils.yaml_fast import fast_safe_load
 from scripts.run_business_flow import load_llm_config
 
 def yaml_to_payload(yaml_dict: dict, api_key: str) -> dict:
@@ -31,7 +31,7 @@ def create_manager_with_roles(yaml_path: Path, headers, base_url: str, log_file:
     - Attaches role IDs back to the manager before creating it.
     """
     with open(yaml_path, "r") as f:
-        business_yaml = yaml.safe_load(f)
+        business_yaml = fast_safe_load(f)
 
     manager_yaml = business_yaml["manager"]
 
@@ -39,7 +39,9 @@ def create_manager_with_roles(yaml_path: Path, headers, base_url: str, log_file:
     created_roles = []
     for role in manager_yaml.get("managed_agents", []):
         if "yaml" in role:
-            role_yaml = yaml.safe_load(role["yaml"])
+            raw = role["yaml"]
+            # Already-parsed inline roles skip the YAML parse
+            role_yaml = raw if isinstance(raw, dict) else fast_safe_load(raw)
             role_payload = yaml_to_payload(role_yaml, api_key)
             role_result = create_agent_from_yaml(role_payload, headers, base_url)
             created_roles.append(role_result)
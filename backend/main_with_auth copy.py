@@ -3,8 +3,8 @@
 import os
 import json
 import logging
-import pytz
 from datetime import datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
@@ -54,12 +54,12 @@ app.add_middleware(
 # -----------------------------
 # Helpers
 # -----------------------------
-def _tz(tz_name: str | None = None) -> pytz.timezone:
+def _tz(tz_name: str | None = None) -> ZoneInfo:
     tz_name = tz_name or os.getenv("APP_TZ", "America/Los_Angeles")
     try:
-        return pytz.timezone(tz_name)
-    except Exception:
-        return pytz.timezone("America/Los_Angeles")
+        return ZoneInfo(tz_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo("America/Los_Angeles")
 
 
 def _timestamp_str(tz_name: str | None = None) -> str:
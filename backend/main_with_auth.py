@@ -1,8 +1,9 @@
 import os
 import json
+import asyncio
 import logging
-import pytz
-from datetime import datetime
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,6 +12,8 @@ import httpx
 from scripts.create_manager_with_roles import create_manager_with_roles
 from src.api.client_async import LyzrAPIClient
 from src.utils.auth import get_current_user, UserClaims
+from src.utils import json_fast
+from src.utils.timestamps import resolve_tz, timestamp_str
 
 # -----------------------------
 # Environment
@@ -28,9 +31,11 @@ logger = logging.getLogger("agent-api")
 
 
 def trace(msg: str, extra: dict | None = None):
-    """Helper for structured logging"""
+    """Helper for structured logging (no serialization work when INFO is filtered)"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     if extra:
-        logger.info(f"{msg} | {json.dumps(extra, ensure_ascii=False)}")
+        logger.info("%s | %s", msg, json.dumps(extra, ensure_ascii=False))
     else:
         logger.info(msg)
 
@@ -53,21 +58,81 @@ app.add_middleware(
 # -----------------------------
 # Helpers
 # -----------------------------
-def _tz(tz_name: str | None = None) -> pytz.timezone:
-    tz_name = tz_name or os.getenv("APP_TZ", "America/Los_Angeles")
-    try:
-        return pytz.timezone(tz_name)
-    except Exception:
-        return pytz.timezone("America/Los_Angeles")
+STUDIO_API_BASE = os.getenv("STUDIO_API_URL", "https://agent-prod.studio.lyzr.ai")
+DEFAULT_API_KEY = os.getenv("STUDIO_API_KEY")
 
 
-def _timestamp_str(tz_name: str | None = None) -> str:
-    now = datetime.now(_tz(tz_name))
-    return now.strftime("%d%b%Y-%I:%M%p %Z").upper()
+CLIENT_CACHE_SIZE = 256
+_client_cache: "OrderedDict[str, LyzrAPIClient]" = OrderedDict()
+_client_leases: dict[LyzrAPIClient, int] = {}  # in-flight requests per client
+_retired_clients: set[LyzrAPIClient] = set()  # evicted while still leased
+_close_tasks: set[asyncio.Task] = set()  # strong refs until each close finishes
 
 
-STUDIO_API_BASE = os.getenv("STUDIO_API_URL", "https://agent-prod.studio.lyzr.ai")
-DEFAULT_API_KEY = os.getenv("STUDIO_API_KEY")
+def _schedule_close(client: LyzrAPIClient):
+    task = asyncio.get_running_loop().create_task(client.aclose())
+    _close_tasks.add(task)
+    task.add_done_callback(_close_tasks.discard)
+
+
+def _get_client(api_key: str) -> LyzrAPIClient:
+    """
+    One pooled Studio client per API key, reused across requests.
+    Bounded LRU: an evicted client is closed once no request is using it.
+    Only called from the event loop thread, so no lock is needed.
+    """
+    client = _client_cache.get(api_key)
+    if client is not None:
+        _client_cache.move_to_end(api_key)
+        return client
+
+    client = LyzrAPIClient(base_url=STUDIO_API_BASE, api_key=api_key).open()
+    _client_cache[api_key] = client
+    if len(_client_cache) > CLIENT_CACHE_SIZE:
+        _, evicted = _client_cache.popitem(last=False)
+        if evicted in _client_leases:
+            _retired_clients.add(evicted)
+        else:
+            _schedule_close(evicted)
+    return client
+
+
+@asynccontextmanager
+async def _leased_client(api_key: str):
+    """Hold the key's client for one request so eviction cannot close it mid-flight."""
+    client = _get_client(api_key)
+    _client_leases[client] = _client_leases.get(client, 0) + 1
+    try:
+        yield client
+    finally:
+        remaining = _client_leases.pop(client) - 1
+        if remaining:
+            _client_leases[client] = remaining
+        elif client in _retired_clients:
+            _retired_clients.discard(client)
+            _schedule_close(client)
+
+
+async def _json_body(request: Request) -> dict:
+    """Decode the raw request body with orjson and require a JSON object."""
+    try:
+        body = json_fast.loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Request body must be valid JSON")
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object")
+    return body
+
+
+@app.on_event("shutdown")
+async def _close_clients():
+    while _client_cache:
+        _, client = _client_cache.popitem()
+        await client.aclose()
+    while _retired_clients:
+        await _retired_clients.pop().aclose()
+    if _close_tasks:
+        await asyncio.gather(*_close_tasks, return_exceptions=True)
 
 
 # -----------------------------
@@ -87,7 +152,7 @@ async def create_agents(
     Create manager + role agents from incoming JSON.
     """
     try:
-        body = await request.json()
+        body = await _json_body(request)
         trace("📥 Incoming JSON body keys", {"keys": list(body.keys())})
 
         manager_json = body.get("manager_json")
@@ -99,9 +164,9 @@ async def create_agents(
         if not studio_api_key:
             raise HTTPException(status_code=400, detail="studio_api_key is required")
 
-        trace("🔑 Authenticated user", {"user": user.dict()})
+        trace("🔑 Authenticated user", {"user": user.model_dump()})
 
-        async with LyzrAPIClient(base_url=STUDIO_API_BASE, api_key=studio_api_key) as client:
+        async with _leased_client(studio_api_key) as client:
             result = await create_manager_with_roles(client, manager_json)
 
         if not result or not result.get("ok"):
@@ -113,7 +178,7 @@ async def create_agents(
 
         return {
             "ok": True,
-            "timestamp": _timestamp_str(tz_name),
+            "timestamp": timestamp_str(resolve_tz(tz_name)),
             "manager": manager,
             "roles": result.get("roles", []),
         }
@@ -138,7 +203,7 @@ async def run_inference(
     Supports both /chat/ (default) and /stream/ modes.
     """
     try:
-        body = await request.json()
+        body = await _json_body(request)
         trace("📥 Inference request body", {"keys": list(body.keys())})
 
         agent_id = body.get("agent_id")
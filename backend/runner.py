@@ -1,42 +1,54 @@
-import yaml, os, json
+import os, json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import httpx
 from src.utils.normalize_output import normalize_inference_output
+from src.utils.yaml_fast import fast_safe_load
 
 
 USE_CASES_DIR = Path("agents/use_cases")
+OUTPUTS_DIR = Path("outputs")
+MAX_WORKERS = int(os.getenv("LYZR_MAX_CONCURRENCY", "8"))
+
+def _run_one_use_case(http: httpx.Client, manager_id: str, case: dict, chat_url: str, headers: dict) -> dict:
+    uc_name = case["name"]
+    print(f"📥 Running use case: {uc_name}")
+    payload = {
+        "agent_id": manager_id,
+        "user_id": "bolt-orchestrator",
+        "session_id": f"{manager_id}-{os.urandom(4).hex()}",
+        "message": case["description"],
+    }
+    # Resolve the per-case output paths once; normalize_inference_output creates out_dir
+    out_dir = OUTPUTS_DIR / uc_name
+    out_file = out_dir / f"{uc_name}.json"
+    try:
+        resp = http.post(chat_url, headers=headers, json=payload, timeout=90)
+        resp.raise_for_status()
+        normalized = normalize_inference_output(resp.text, out_dir)
+
+        # save YAML output
+        with open(out_file, "w") as f:
+            json.dump(normalized, f, indent=2)
+
+        return {"use_case": uc_name, "status": "ok", "output_file": str(out_file)}
+    except Exception as e:
+        return {"use_case": uc_name, "status": "error", "error": str(e)}
 
 def run_use_cases_with_manager(manager_id: str, api_key: str):
     base_url = os.getenv("LYZR_BASE_URL", "https://agent-prod.studio.lyzr.ai")
     headers = {"x-api-key": api_key, "Content-Type": "application/json"}
-    results = []
+    chat_url = f"{base_url}/v3/inference/chat/"
 
+    cases = []
     for uc_file in USE_CASES_DIR.glob("use_cases_*.yaml"):
         with open(uc_file, "r") as f:
-            use_cases = yaml.safe_load(f).get("use_cases", [])
-
-        for case in use_cases:
-            uc_name = case["name"]
-            print(f"📥 Running use case: {uc_name}")
-            payload = {
-                "agent_id": manager_id,
-                "user_id": "bolt-orchestrator",
-                "session_id": f"{manager_id}-{os.urandom(4).hex()}",
-                "message": case["description"],
-            }
-            try:
-                resp = httpx.post(f"{base_url}/v3/inference/chat/", headers=headers, json=payload, timeout=90)
-                resp.raise_for_status()
-                normalized = normalize_inference_output(resp_text, Path(f"outputs/{use_case_name}"))
-
-                # save YAML output
-                out_dir = Path(f"outputs/{uc_name}")
-                out_dir.mkdir(parents=True, exist_ok=True)
-                with open(out_dir / f"{uc_name}.json", "w") as f:
-                    json.dump(normalized, f, indent=2)
-
-                results.append({"use_case": uc_name, "status": "ok", "output_file": str(out_dir / f"{uc_name}.json")})
-            except Exception as e:
-                results.append({"use_case": uc_name, "status": "error", "error": str(e)})
-
-    return results
+            cases.extend(fast_safe_load(f).get("use_cases", []))
+
+    # Inference calls are independent and network-bound: run them concurrently,
+    # map() keeps results in use-case order
+    # One keep-alive pool shared by the worker threads: every call reuses warm connections
+    limits = httpx.Limits(max_connections=MAX_WORKERS, max_keepalive_connections=MAX_WORKERS)
+    with httpx.Client(transport=httpx.HTTPTransport(retries=3, limits=limits)) as http, \
+            ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        return list(pool.map(lambda case: _run_one_use_case(http, manager_id, case, chat_url, headers), cases))
@@ -1,17 +1,16 @@
 # backend/schemas/agent_action.py
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict
 
 class AgentActionRequest(BaseModel):
-    file: str = Field(..., description="YAML content or path to the manager/role agent file")
-    name: Optional[str] = Field(None, description="Optional agent name")
-    description: Optional[str] = Field(None, description="Optional description of the agent or workflow")
-    type: Optional[str] = Field("manager", description="Type of agent being created: 'manager' or 'role'")
-    metadata: Optional[Dict[str, str]] = Field(default_factory=dict, description="Additional metadata or tags")
-
-    class Config:
-        schema_extra = {
+    # Pydantic v2: validation runs in pydantic-core (Rust). Internal callers that
+    # already hold trusted data should use AgentActionRequest.model_construct(**data)
+    # to skip validation; full validation stays on the public request boundary.
+    model_config = ConfigDict(
+        extra="ignore",
+        str_strip_whitespace=False,
+        json_schema_extra={
             "example": {
                 "file": "name: MyAgent\nagent_role: assistant\nagent_goal: Help with tasks\n...",
                 "name": "MyAgent",
@@ -19,4 +18,11 @@ class AgentActionRequest(BaseModel):
                 "type": "manager",
                 "metadata": {"project": "demo", "version": "v1"}
             }
-        }
+        },
+    )
+
+    file: str = Field(..., description="YAML content or path to the manager/role agent file")
+    name: Optional[str] = Field(None, description="Optional agent name")
+    description: Optional[str] = Field(None, description="Optional description of the agent or workflow")
+    type: Optional[str] = Field("manager", description="Type of agent being created: 'manager' or 'role'")
+    metadata: Optional[Dict[str, str]] = Field(default_factory=dict, description="Additional metadata or tags")
@@ -3,6 +3,11 @@ import json, yaml, os
 from jsonschema import validate, ValidationError
 from datetime import datetime
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 ARCHITECT_SCHEMA = {
     "type": "object",
     "properties": {
@@ -27,7 +32,7 @@ ARCHITECT_SCHEMA = {
 @task
 def load_use_case(file_path: str) -> str:
     with open(file_path, "r") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_SafeLoader)
     return data["use_case"]
 
 @task
@@ -6,10 +6,15 @@ import yaml
 import httpx
 from pathlib import Path
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 
 from prefect import flow, task
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # ------------------------------------------------------------------------------
 # Utilities
 # ------------------------------------------------------------------------------
@@ -23,7 +28,7 @@ API_KEY = os.getenv("LYZR_API_KEY")
 HEADERS = {"x-api-key": API_KEY, "Content-Type": "application/json"}
 
 def to_pst_str() -> str:
-    pst = pytz.timezone("America/Los_Angeles")
+    pst = ZoneInfo("America/Los_Angeles")
     return datetime.now(pst).strftime("%Y-%m-%d %I:%M %p %Z")
 
 def timestamp_str() -> str:
@@ -36,7 +41,7 @@ def save_json(data: dict, path: Path):
 
 def load_yaml(path: Path) -> dict:
     with open(path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoader)
 
 # ------------------------------------------------------------------------------
 # Tasks
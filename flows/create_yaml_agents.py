@@ -4,6 +4,11 @@ from pathlib import Path
 import yaml
 from prefect import flow, task
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 ROOT_DIR = Path(__file__).resolve().parent.parent
 AGENT_DIR = ROOT_DIR / "agents"
 UPDATEME_FILE = ROOT_DIR / "UPDATEME.yaml"
@@ -17,7 +22,7 @@ def read_updateme_yaml():
     if not UPDATEME_FILE.exists():
         raise FileNotFoundError(f"❌ Missing {UPDATEME_FILE}")
     with open(UPDATEME_FILE, "r") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_SafeLoader)
     return data
 
 # Uses values from UPDATEME.yaml to build Manager and Role YAMLs    
@@ -5,17 +5,22 @@ import uuid
 import yaml
 import httpx
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 
 from prefect import flow, task
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 # ------------------------------------------------------------------------------
 # Utilities
 # ------------------------------------------------------------------------------
 
 def to_pst_str() -> str:
-    pst = pytz.timezone("America/Los_Angeles")
+    pst = ZoneInfo("America/Los_Angeles")
     return datetime.now(pst).strftime("%Y-%m-%d %I:%M %p %Z")
 
 
@@ -38,7 +43,7 @@ def save_yaml(data: dict, path: str):
 @task
 def load_yaml(path: str) -> dict:
     with open(path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoader)
 
 
 @task
@@ -136,7 +141,7 @@ def parse_response(resp: dict) -> dict:
 
         parsed = {
             "workflow_name": workflow_name,
-            "workflow_yaml": yaml.safe_load(workflow_yaml),
+            "workflow_yaml": yaml.load(workflow_yaml, Loader=_SafeLoader),
             "agents": []
         }
 
@@ -144,7 +149,7 @@ def parse_response(resp: dict) -> dict:
             parsed["agents"].append({
                 "name": a.get("name"),
                 "type": a.get("type"),
-                "yaml": yaml.safe_load(a.get("yaml")) if a.get("yaml") else {}
+                "yaml": yaml.load(a.get("yaml"), Loader=_SafeLoader) if a.get("yaml") else {}
             })
 
         return parsed
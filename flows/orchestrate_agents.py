@@ -3,10 +3,10 @@
 
 from prefect import flow, task, get_run_logger
 from prefect.runtime import task_run
-import yaml
+from src.utils.yaml_fast import fast_safe_load
 from pathlib import Path
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 
 # Import your real Lyzr client
 from src.api.client import LyzrAPIClient
@@ -16,7 +16,7 @@ client = LyzrAPIClient()
 
 def pst_now_str() -> str:
     """Return current time in PST for consistent logging."""
-    pst = pytz.timezone("America/Los_Angeles")
+    pst = ZoneInfo("America/Los_Angeles")
     return datetime.now(pst).strftime("%Y-%m-%d %I:%M %p %Z")
 
 
@@ -28,7 +28,7 @@ def pst_now_str() -> str:
 def load_config(path: str = "UPDATEME.yaml") -> dict:
     """Load orchestration config from YAML file."""
     with open(path, "r") as f:
-        return yaml.safe_load(f)
+        return fast_safe_load(f)
 
 
 @task
@@ -103,6 +103,15 @@ def execute_workflow_task(file_path: str) -> dict:
     return {"file": file_path, "run_info": run_info}
 
 
+# action name -> (task, task-run name prefix)
+_ACTION_TASKS = {
+    "create_agents": (create_agent_task, "create_agent"),
+    "update_agents": (update_agent_task, "update_agent"),
+    "create_workflows": (create_workflow_task, "create_workflow"),
+    "execute_workflows": (execute_workflow_task, "execute_workflow"),
+}
+
+
 @task
 def dispatch_actions(cfg: dict) -> list:
     """Dispatch actions defined in config YAML."""
@@ -117,41 +126,21 @@ def dispatch_actions(cfg: dict) -> list:
             logger.info(f"❌ Action '{action}' skipped")
             continue
 
+        handler = _ACTION_TASKS.get(action)
+        if handler is None:
+            logger.warning(f"⚠️ Unknown action: {action}")
+            continue
+
         logger.info(f"✅ Action '{action}' enabled with {len(files)} file(s)")
 
+        action_task, run_prefix = handler
         for fpath in files:
             short_name = Path(fpath).stem
-
-            if action == "create_agents":
-                results.append(
-                    create_agent_task.with_options(
-                        name=f"create_agent:{short_name}"
-                    ).submit(fpath)
-                )
-
-            elif action == "update_agents":
-                results.append(
-                    update_agent_task.with_options(
-                        name=f"update_agent:{short_name}"
-                    ).submit(fpath)
-                )
-
-            elif action == "create_workflows":
-                results.append(
-                    create_workflow_task.with_options(
-                        name=f"create_workflow:{short_name}"
-                    ).submit(fpath)
-                )
-
-            elif action == "execute_workflows":
-                results.append(
-                    execute_workflow_task.with_options(
-                        name=f"execute_workflow:{short_name}"
-                    ).submit(fpath)
-                )
-
-            else:
-                logger.warning(f"⚠️ Unknown action: {action}")
+            results.append(
+                action_task.with_options(
+                    name=f"{run_prefix}:{short_name}"
+                ).submit(fpath)
+            )
 
     return results
 
@@ -4,6 +4,11 @@ import os, yaml, json
 from datetime import datetime
 from jsonschema import validate, ValidationError
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # --- Canonical schema ---
 ARCHITECT_SCHEMA = {
     "type": "object",
@@ -31,7 +36,7 @@ ARCHITECT_SCHEMA = {
 def load_use_cases(file_path: str) -> list:
     logger = get_run_logger()
     with open(file_path, "r") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_SafeLoader)
     active = [uc for uc in data["use_cases"] if uc.get("status") == "active"]
     logger.info(f"🔎 Found {len(active)} active use cases: {[uc['id'] for uc in active]}")
     return active
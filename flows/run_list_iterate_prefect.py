@@ -5,7 +5,7 @@ import json
 from pathlib import Path
 from datetime import datetime
 
-import yaml
+from src.utils.yaml_fast import fast_safe_load, fast_safe_dump
 from prefect import flow, task
 
 from src.api.client import LyzrAPIClient
@@ -58,7 +58,7 @@ def save_agent_yaml(agent: dict, out_dir: Path, roles_dir: Path, uc_name: str) -
 def update_manager_yaml(manager_file: str, role_agents: list[str], uc_name: str) -> str:
     """Append managed_agents section with canonical role paths."""
     with open(manager_file, "r") as f:
-        mgr_yaml = yaml.safe_load(f)
+        mgr_yaml = fast_safe_load(f)
 
     mgr_yaml["managed_agents"] = [
         {
@@ -69,7 +69,7 @@ def update_manager_yaml(manager_file: str, role_agents: list[str], uc_name: str)
     ]
 
     with open(manager_file, "w") as f:
-        yaml.safe_dump(mgr_yaml, f, sort_keys=False)
+        fast_safe_dump(mgr_yaml, f, sort_keys=False)
 
     print(f"🔗 [{uc_name}] Updated Manager {mgr_yaml.get('name','<unknown>')} with {len(role_agents)} managed_agents")
     return manager_file
@@ -151,7 +151,7 @@ def run_usecase_flow(manager_yaml: str, usecase: dict, save_outputs: bool = True
 def run_all_usecases(manager_yaml: str, usecases_file: str, save_outputs: bool = True, push: bool = False):
     """Top-level flow to run all use cases sequentially."""
     with open(usecases_file, "r") as f:
-        usecases = yaml.safe_load(f).get("use_cases", [])
+        usecases = fast_safe_load(f).get("use_cases", [])
 
     for uc in usecases:
         uc_name = uc.get("name", "unnamed").replace("_", " ").title()
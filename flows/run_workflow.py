@@ -1,6 +1,6 @@
 import os
 import sys
-import yaml
+from src.utils.yaml_fast import fast_safe_load
 from src.services.create_from_yaml import create_agent_from_yaml
 from src.api.client import LyzrAPIClient
 from src.services.agent_manager import AgentManager
@@ -12,7 +12,7 @@ def run_workflow(yaml_file: str = "WORKFLOW.yaml"):
     For each manager, ensures role agents are created first, then the manager.
     """
     with open(yaml_file, "r") as f:
-        config = yaml.safe_load(f)
+        config = fast_safe_load(f)
 
     client = LyzrAPIClient(debug=os.getenv("LYZR_DEBUG", "0") == "1")
     manager_service = AgentManager(client)
@@ -24,7 +24,7 @@ def run_workflow(yaml_file: str = "WORKFLOW.yaml"):
 
         # Load manager YAML
         with open(manager_file, "r") as f:
-            mgr_yaml = yaml.safe_load(f)
+            mgr_yaml = fast_safe_load(f)
 
         # Collect managed agents
         managed_agents = mgr_yaml.get("managed_agents", [])
@@ -1,6 +1,6 @@
 import os
 import json
-import yaml
+from src.utils.yaml_fast import fast_safe_load
 from pathlib import Path
 from datetime import datetime
 
@@ -86,7 +86,7 @@ def hr_use_case_flow(manager_yaml: str, use_cases_file: str):
 
     # 2. Load use cases
     with open(use_cases_file, "r") as f:
-        use_cases = yaml.safe_load(f)["use_cases"]
+        use_cases = fast_safe_load(f)["use_cases"]
 
     # 3. Output dir
     out_dir = Path("output") / Path(use_cases_file).stem
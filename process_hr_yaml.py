@@ -1,10 +1,25 @@
-import json
-import yaml
 import sys
 import re
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from src.utils.save_utils import save_structured_yaml
 from src.utils.postprocess_yaml import postprocess_yaml
+from src.utils.yaml_fast import fast_safe_load
+from src.utils import json_fast
+
+
+REPAIR_KEYS = (
+    "name:", "description:", "agent_role:", "agent_goal:", "agent_instructions:",
+    "examples:", "features:", "tools:", "response_format:", "provider_id:",
+    "model:", "temperature:", "top_p:", "structured_output_examples:",
+    "managed_agents:", "tool_usage_description:",
+)
+# One scan for all keys; longest first so e.g. `tool_usage_description:` wins over `description:`
+_REPAIR_RE = re.compile(
+    r"(?<!\n)(" + "|".join(re.escape(k) for k in sorted(REPAIR_KEYS, key=len, reverse=True)) + ")"
+)
 
 
 def repair_yaml(text: str) -> str:
@@ -13,16 +28,62 @@ def repair_yaml(text: str) -> str:
     """
     if not text:
         return text
+    return _REPAIR_RE.sub(r"\n\1", text)
+
+
+@lru_cache(maxsize=512)
+def _parse_repaired_yaml_cached(text: str):
+    # LLMs often emit these blocks as JSON; that is tried first since JSON is
+    # valid YAML and parses far faster (and repair_yaml would mangle it).
+    if text.lstrip()[:1] in ("{", "["):
+        try:
+            return json_fast.loads(text)
+        except ValueError:
+            pass
+    return fast_safe_load(repair_yaml(text))
+
+
+def parse_repaired_yaml(text: str):
+    """
+    repair_yaml + parse, memoized in-process by content so re-processing the
+    same agent YAML skips both the regex repair and the YAML parse.
+    Returns a fresh copy on every call; callers may mutate it.
+    """
+    return copy.deepcopy(_parse_repaired_yaml_cached(text))
+
+
+def _process_one_agent(agent: dict, base_dir: Path):
+    """Parse, post-process and save one agent YAML from the response."""
+    agent_name = agent.get("name", "UnnamedAgent")
+    agent_yaml_text = agent.get("yaml", "")
+
+    if not agent_yaml_text:
+        return
+
+    try:
+        parsed = parse_repaired_yaml(agent_yaml_text)
+
+        if not isinstance(parsed, dict):
+            raise ValueError("Top-level agent YAML is not a dict")
+
+        # Run canonical post-processing
+        parsed = postprocess_yaml(parsed)
+
+        # Save agent definition
+        agent_dir = base_dir / agent_name
+        agent_dir.mkdir(parents=True, exist_ok=True)
+        out_path = agent_dir / "agent_definition.yaml"
+
+        save_structured_yaml(parsed, out_path)
+        (agent_dir / "raw.json").write_bytes(json_fast.dumps(agent, indent=True))
 
-    keys = [
-        "name:", "description:", "agent_role:", "agent_goal:", "agent_instructions:",
-        "examples:", "features:", "tools:", "response_format:", "provider_id:",
-        "model:", "temperature:", "top_p:", "structured_output_examples:",
-        "managed_agents:", "tool_usage_description:", "tools:"
-    ]
-    for key in keys:
-        text = re.sub(rf"(?<!\n){key}", f"\n{key}", text)
-    return text
+        print(f"✅ Saved structured YAML → {out_path}")
+
+    except Exception as e:
+        print(f"⚠️ Failed to parse agent '{agent_name}': {e}")
+        fail_dir = base_dir / "failed"
+        fail_dir.mkdir(exist_ok=True)
+        (fail_dir / f"{agent_name}_raw.yaml").write_text(repair_yaml(agent_yaml_text))
 
 
 def main():
@@ -32,12 +93,11 @@ def main():
     else:
         in_path = Path("output/workflows/use_cases_hr/raw.json")
 
-    if not in_path.exists():
+    try:
+        raw = json_fast.loads(in_path.read_bytes())
+    except FileNotFoundError:
         print(f"❌ raw.json not found at {in_path}")
         return
-
-    try:
-        raw = json.loads(in_path.read_text())
     except Exception as e:
         print(f"⚠️ Failed to parse raw.json: {e}")
         return
@@ -52,7 +112,7 @@ def main():
 
     # ✅ Parse embedded JSON from the response
     try:
-        response_json = json.loads(response_str)
+        response_json = json_fast.loads(response_str)
     except Exception as e:
         print(f"⚠️ Embedded response not clean JSON: {e}")
         fail_dir = in_path.parent / "failed"
@@ -68,48 +128,19 @@ def main():
     workflow_parsed = None
     if workflow_yaml_text:
         try:
-            workflow_yaml_text = repair_yaml(workflow_yaml_text)
-            workflow_parsed = yaml.safe_load(workflow_yaml_text)
+            workflow_parsed = parse_repaired_yaml(workflow_yaml_text)
         except Exception as e:
             print(f"⚠️ Failed to parse workflow_yaml: {e}")
             fail_dir = in_path.parent / "failed"
             fail_dir.mkdir(exist_ok=True)
-            (fail_dir / "workflow_raw.yaml").write_text(workflow_yaml_text)
+            (fail_dir / "workflow_raw.yaml").write_text(repair_yaml(workflow_yaml_text))
 
     # --- Process each agent YAML ---
-    for agent in agents:
-        agent_name = agent.get("name", "UnnamedAgent")
-        agent_yaml_text = agent.get("yaml", "")
-
-        if not agent_yaml_text:
-            continue
-
-        try:
-            agent_yaml_text = repair_yaml(agent_yaml_text)
-            parsed = yaml.safe_load(agent_yaml_text)
-
-            if not isinstance(parsed, dict):
-                raise ValueError("Top-level agent YAML is not a dict")
-
-            # Run canonical post-processing
-            parsed = postprocess_yaml(parsed)
-
-            # Save agent definition
-            agent_dir = in_path.parent / agent_name
-            agent_dir.mkdir(parents=True, exist_ok=True)
-            out_path = agent_dir / "agent_definition.yaml"
-
-            save_structured_yaml(parsed, out_path)
-            (agent_dir / "raw.json").write_text(json.dumps(agent, indent=2))
-
-            print(f"✅ Saved structured YAML → {out_path}")
-
-        except Exception as e:
-            print(f"⚠️ Failed to parse agent '{agent_name}': {e}")
-            fail_dir = in_path.parent / "failed"
-            fail_dir.mkdir(exist_ok=True)
-            (fail_dir / f"{agent_name}_raw.yaml").write_text(agent_yaml_text)
-
+    # Agents are independent; overlap their parse and disk writes (libyaml and
+    # file I/O release the GIL)
+    if agents:
+        with ThreadPoolExecutor(max_workers=min(8, len(agents))) as pool:
+            list(pool.map(lambda agent: _process_one_agent(agent, in_path.parent), agents))
 
 if __name__ == "__main__":
     main()
@@ -1,18 +1,24 @@
+from __future__ import annotations
+
 import sys
 import json
-import yaml
 import argparse
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from src.api.client import LyzrAPIClient
-from src.utils.prompt_builder import build_system_prompt
-from src.utils.payload_normalizer import normalize_payload
+# Heavy imports are deferred so `--help` and bad-path exits don't pay for them.
+if TYPE_CHECKING:
+    from src.api.client import LyzrAPIClient
 
 
 def create_agent(yaml_path: str, client: LyzrAPIClient, debug: bool = False):
     """Create a single agent from a YAML definition."""
-    with open(yaml_path, "r") as f:
-        agent_yaml = yaml.safe_load(f)
+    from src.utils.prompt_builder import build_system_prompt
+    from src.utils.payload_normalizer import normalize_payload
+    from src.utils.yaml_fast import fast_safe_load
+
+    with open(yaml_path, "rb") as f:
+        agent_yaml = fast_safe_load(f)
 
     # Normalize payload
     payload = normalize_payload(agent_yaml)
@@ -45,13 +51,15 @@ def main():
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
     args = parser.parse_args()
 
-    client = LyzrAPIClient(debug=args.debug)
     yaml_path = Path(args.yaml_file)
 
     if not yaml_path.exists():
         print(f"❌ File not found: {yaml_path}")
         sys.exit(1)
 
+    from src.api.client import LyzrAPIClient
+    client = LyzrAPIClient(debug=args.debug)
+
     create_agent(str(yaml_path), client, debug=args.debug)
 
 
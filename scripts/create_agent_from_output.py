@@ -2,7 +2,6 @@
 
 import sys
 from pathlib import Path
-from src.api.client import LyzrAPIClient
 
 def main():
     if len(sys.argv) < 2:
@@ -14,6 +13,7 @@ def main():
         print(f"❌ File not found: {yaml_file}")
         sys.exit(1)
 
+    from src.api.client import LyzrAPIClient
     client = LyzrAPIClient(debug=True, timeout=180)
 
     print(f"📤 Creating agent from {yaml_file} ...")
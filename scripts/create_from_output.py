@@ -1,45 +1,58 @@
 # scripts/create_from_output.py
 
+from __future__ import annotations
+
 import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+# Client/service imports are deferred until the root folder is validated.
+if TYPE_CHECKING:
+    from src.api.client import LyzrAPIClient
+    from src.services.agent_manager import AgentManager
 
-from src.api.client import LyzrAPIClient
-from src.services.agent_manager import AgentManager
-from src.services.workflow_manager import create_workflow_from_yaml
+logger = logging.getLogger("create-from-output")
 
 
 def process_subfolder(client: LyzrAPIClient, manager: AgentManager, folder: Path):
-    """Create Manager + Roles and Workflow from a subfolder"""
+    """Create Manager + Roles and Workflow from a subfolder."""
+    from src.services.workflow_manager import create_workflow_from_yaml
+
+    # Folders run concurrently, so every line names the folder it belongs to
+    logger.info("📂 Processing subfolder: %s", folder)
+
     # 1. Find Manager YAML
     mgr_files = list(folder.glob("*Manager*.yaml"))
     if not mgr_files:
-        print(f"⚠️ No Manager YAML found in {folder}")
+        logger.warning("⚠️ No Manager YAML found in %s", folder)
         return
     manager_yaml_path = mgr_files[0]
 
     # 2. Create Manager + Roles
-    print(f"\n🚀 Creating Manager + Roles from {manager_yaml_path}")
+    logger.info("🚀 Creating Manager + Roles from %s", manager_yaml_path)
     mgr_result = manager.create_manager_with_roles(str(manager_yaml_path))
     if not mgr_result:
-        print(f"❌ Manager creation failed for {manager_yaml_path}")
+        logger.error("❌ Manager creation failed for %s", manager_yaml_path)
         return
-    print(f"✅ Manager created: {mgr_result.get('name')} (id={mgr_result.get('agent_id')})")
+    logger.info("✅ Manager created in %s: %s (id=%s)", folder, mgr_result.get("name"), mgr_result.get("agent_id"))
 
     # 3. Find Workflow YAML
     wf_files = sorted(folder.glob("workflow_*.yaml"))
     if not wf_files:
-        print(f"⚠️ No workflow YAML found in {folder}")
+        logger.warning("⚠️ No workflow YAML found in %s", folder)
         return
     workflow_yaml_path = wf_files[-1]  # pick latest by filename sort
 
     # 4. Create Workflow
-    print(f"🚀 Creating Workflow from {workflow_yaml_path}")
+    logger.info("🚀 Creating Workflow from %s", workflow_yaml_path)
     wf_result = create_workflow_from_yaml(client, str(workflow_yaml_path))
     if not wf_result.get("ok"):
-        print(f"❌ Workflow creation failed in {folder}: {wf_result}")
+        logger.error("❌ Workflow creation failed in %s: %s", folder, wf_result)
     else:
         data = wf_result.get("data", {})
-        print(f"✅ Workflow created: {data.get('flow_name')} (id={data.get('flow_id')})")
+        logger.info("✅ Workflow created in %s: %s (id=%s)", folder, data.get("flow_name"), data.get("flow_id"))
 
 
 def main():
@@ -56,21 +69,41 @@ def main():
         action="store_true",
         help="Enable debug logging",
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Suppress per-folder progress logs; warnings and failures are still shown",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Subfolders processed concurrently (default: 8)",
+    )
     args = parser.parse_args()
 
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format="%(message)s",
+    )
+
     root_path = Path(args.root_folder)
     if not root_path.exists():
         print(f"❌ Root folder not found: {root_path}")
         return
 
+    from src.api.client import LyzrAPIClient
+    from src.services.agent_manager import AgentManager
+
     client = LyzrAPIClient(debug=args.debug)
     manager = AgentManager(client)
 
-    # Iterate subfolders
-    for sub in sorted(root_path.iterdir()):
-        if sub.is_dir():
-            print(f"\n📂 Processing subfolder: {sub}")
-            process_subfolder(client, manager, sub)
+    # Subfolders are independent and I/O bound: process them concurrently.
+    # Lines from different folders interleave (AgentManager also prints to
+    # stdout directly), so the logger lines carry the folder path instead.
+    subfolders = [sub for sub in sorted(root_path.iterdir()) if sub.is_dir()]
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        list(pool.map(lambda sub: process_subfolder(client, manager, sub), subfolders))
 
 
 if __name__ == "__main__":
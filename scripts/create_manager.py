@@ -1,5 +1,4 @@
 import argparse
-from src.services.agent_manager import AgentManager
 
 def main():
     parser = argparse.ArgumentParser(description="Create a Manager Agent from YAML definition")
@@ -7,6 +6,7 @@ def main():
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     args = parser.parse_args()
 
+    from src.services.agent_manager import AgentManager
     manager = AgentManager(debug=args.debug)
     resp = manager.create_agent(args.yaml_file)
 
@@ -1,12 +1,12 @@
 import sys
 import os
-import json
 from pathlib import Path
 from datetime import datetime
 
 from src.api.client import LyzrAPIClient
 from src.services.agent_manager import AgentManager
 from src.utils.normalize_output import normalize_inference_output
+from src.utils import json_fast
 
 
 def run_inference(client: LyzrAPIClient, agent_id: str, message: str, out_dir: Path):
@@ -28,18 +28,18 @@ def run_inference(client: LyzrAPIClient, agent_id: str, message: str, out_dir: P
 
     # 1. Save raw response
     raw_file = out_dir / f"inference_raw_{ts}.json"
-    with open(raw_file, "w") as f:
-        json.dump(resp, f, indent=2)
+    # orjson encodes to bytes in one go; a single write instead of json.dump's chunked writes
+    raw_file.write_bytes(json_fast.dumps(resp, indent=True))
     print(f"📦 Raw inference response saved to {raw_file}")
 
     # 2. Normalize response
+    norm = None
     if resp.get("ok") and "data" in resp and "response" in resp["data"]:
         raw_str = resp["data"]["response"]
-        norm = normalize_inference_output(raw_str)
+        norm = normalize_inference_output(raw_str, out_dir)
 
         norm_file = out_dir / f"inference_normalized_{ts}.json"
-        with open(norm_file, "w") as f:
-            json.dump(norm, f, indent=2)
+        norm_file.write_bytes(json_fast.dumps(norm, indent=True))
         print(f"✅ Normalized inference output saved to {norm_file}")
     else:
         print("⚠️ No 'response' field found in inference data — skipping normalization.")
@@ -48,15 +48,13 @@ def run_inference(client: LyzrAPIClient, agent_id: str, message: str, out_dir: P
     if isinstance(norm, dict):
         if "workflow_yaml" in norm:
             wf_file = out_dir / "workflow.yaml"
-            with open(wf_file, "w") as f:
-                f.write(norm["workflow_yaml"])
+            wf_file.write_text(norm["workflow_yaml"])
             print(f"📝 Saved workflow.yaml")
 
         for agent in norm.get("agents", []):
             if "yaml" in agent and "name" in agent:
                 fname = out_dir / f"{agent['name']}.yaml"
-                with open(fname, "w") as f:
-                    f.write(agent["yaml"])
+                fname.write_text(agent["yaml"])
                 print(f"📝 Saved {fname.name}")
     return resp
 
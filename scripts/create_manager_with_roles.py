@@ -1,65 +1,246 @@
 # scripts/create_manager_with_roles.py
-# Orchestration: create roles first → rename inline → create manager with linked role IDs
+# Orchestration: create roles first → rename inline → create manager with linked role IDs.
+# create_manager_with_roles is the flow used by the backend (names set before creation);
+# create_manager_and_attach_roles is the CLI flow (id-suffixed rename + attach via PUT).
+# Both take one LyzrAPIClient for the whole run so every call shares its pooled
+# keep-alive connections; pass a long-lived client rather than one per call.
+
+from __future__ import annotations
 
 import os
-import yaml
+import copy
+import hashlib
+import asyncio
 import logging
-import pytz
+import operator
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Union, Dict, Any, List
-from datetime import datetime
+from typing import Union, Dict, Any, List, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 from src.api.client_async import LyzrAPIClient
+from src.utils import json_fast
+from src.utils.timestamps import timestamp_str as _timestamp_str, suffix_from_id as _suffix_from_id, rich_manager_name
+from src.utils.yaml_fast import fast_safe_load
+from src.services.agent_payload import build_payload
 
 logger = logging.getLogger("create-manager-with-roles")
 
-# ---------- Timezone / naming helpers ----------
+# ---------- Naming helpers ----------
+
+def _rich_role_name(base: str, ts: str, agent_id: str | None = None) -> str:
+    # Same scheme as managers, marked with (R); the id suffix only once it is known
+    return "(R) " + rich_manager_name(base, ts, agent_id=agent_id)
+
+# ---------- Prompt + examples builders ----------
+
+def _agent_fields(agent_def: Dict[str, Any]) -> Tuple[str, str, str]:
+    """(agent_role, agent_goal, agent_instructions) as given, "" when missing."""
+    return (
+        agent_def.get("agent_role", ""),
+        agent_def.get("agent_goal", ""),
+        agent_def.get("agent_instructions", ""),
+    )
+
+@lru_cache(maxsize=256)
+def _compose_system_prompt(role: str, goal: str, instr: str) -> str:
+    # Keyed on the field text itself, so recurring role templates across runs hit
+    role, goal, instr = role.strip(), goal.strip(), instr.strip()
+    return "\n\n".join(
+        f"{label}:\n{text}" for label, text in (("ROLE", role), ("GOAL", goal), ("INSTRUCTIONS", instr)) if text
+    )
+
+_DEFAULT_ROLE_DUTY = "Execute delegated sub-tasks from the manager."
+
+def _manager_supervision_instructions(manager_def: Dict[str, Any], created_roles: List[Dict[str, Any]]) -> str:
+    base = manager_def.get("agent_instructions", "").strip()
+    head = f"{base}\nManage these attached roles:" if base else "Manage these attached roles:"
+    # Goals are stripped before the newline swap, so no second strip is needed
+    return "\n".join([head, *(
+        f"- Role '{r['name']}': " + ((r.get("agent_goal") or "").strip().replace("\n", " ") or _DEFAULT_ROLE_DUTY)
+        for r in created_roles
+    )])
+
+# Templates are parsed once at import; callers only substitute names
+_ROLE_EXAMPLES_TEMPLATE = """Expected canonical YAML format for Role agents:
+
+workflow_name: {name}_Flow
+workflow_yaml: |
+  flow_name: {name}_Flow
+  flow_data:
+    tasks:
+      - name: {lower}_task
+        function: call_agent
+        agent: {name}
+agents:
+  - name: {name}
+    type: role
+    yaml: |
+      name: {name}
+      description: Example Role description
+      agent_role: Example Role
+      agent_goal: Example goal
+      agent_instructions: Example instructions
+      features:
+        - type: yaml_role_generation
+          config: {{}}
+          priority: 0
+      tools: []
+      response_format:
+        type: json
+      provider_id: OpenAI
+      model: gpt-4o-mini
+      temperature: 0.3
+      top_p: 0.9
+      llm_credential_id: lyzr_openai
+"""
+
+@lru_cache(maxsize=512)
+def canonical_role_examples(role_name: str) -> str:
+    return _ROLE_EXAMPLES_TEMPLATE.format(name=role_name, lower=role_name.lower())
+
+_MANAGER_EXAMPLES_HEADER = """Expected canonical YAML format for Manager + Roles:
+
+workflow_name: {name}_Flow
+workflow_yaml: |
+  flow_name: {name}_Flow
+  flow_data:
+    tasks:
+      - name: {lower}_task
+        function: call_agent
+        agent: {name}
+agents:
+  - name: {name}
+    type: manager
+    yaml: |
+      name: {name}
+      description: Example Composer Manager description
+      agent_role: Composer Manager
+      agent_goal: Example manager goal
+      agent_instructions: Example instructions
+      features:
+        - type: proposal_generation
+          config: {{}}
+          priority: 1
+      tools: []
+      response_format:
+        type: json
+      provider_id: OpenAI
+      model: gpt-4o-mini
+      temperature: 0.3
+      top_p: 0.9
+      llm_credential_id: lyzr_openai
+"""
+
+_MANAGER_EXAMPLES_ROLE = (
+    "  - name: %(name)s\n    type: role\n    yaml: |\n      name: %(name)s\n"
+    "      description: Example Role description\n      agent_role: Example Role\n"
+    "      agent_goal: Example goal\n      agent_instructions: Example instructions\n"
+    "      features:\n        - type: yaml_role_generation\n          config: {}\n"
+    "          priority: 0\n      tools: []\n      response_format:\n        type: json\n"
+    "      provider_id: OpenAI\n      model: gpt-4o-mini\n      temperature: 0.3\n"
+    "      top_p: 0.9\n      llm_credential_id: lyzr_openai"
+)
+
+def canonical_manager_examples(manager_name: str, role_names: Sequence[str]) -> str:
+    # Tuple-ize so the memoized builder can hash the role list
+    return _canonical_manager_examples(manager_name, tuple(role_names))
+
+@lru_cache(maxsize=256)
+def _canonical_manager_examples(manager_name: str, role_names: Tuple[str, ...]) -> str:
+    header = _MANAGER_EXAMPLES_HEADER.format(name=manager_name, lower=manager_name.lower())
+    roles_block = "\n".join(_MANAGER_EXAMPLES_ROLE % {"name": r} for r in role_names)
+    return "".join((header, roles_block, "\n"))
+
+
+# ---------- Manager file loading ----------
 
-def _tz() -> pytz.timezone:
-    tz_name = os.getenv("APP_TZ", "America/Los_Angeles")
+# Opt-in: LYZR_YAML_JSON_CACHE=1 keeps a <file>.yaml.json sidecar so new processes
+# (CLI runs, backend workers) skip the YAML parse while the source is unchanged
+_YAML_JSON_CACHE = os.getenv("LYZR_YAML_JSON_CACHE", "0") == "1"
+
+def _write_json_sidecar(sidecar: Path, data: Any) -> None:
+    try:
+        blob = json_fast.dumps(data)
+    except TypeError:
+        return
+    if json_fast.loads(blob) != data:
+        # e.g. YAML dates would come back as strings; keep parsing those files
+        return
+    tmp = sidecar.with_name(sidecar.name + ".tmp")
     try:
-        return pytz.timezone(tz_name)
-    except Exception:
-        return pytz.timezone("America/Los_Angeles")
+        tmp.write_bytes(blob)
+        os.replace(tmp, sidecar)
+    except OSError:
+        pass  # read-only checkout etc.; the cache is best-effort
 
-def _timestamp_str() -> str:
-    now = datetime.now(_tz())
-    return now.strftime("%d%b%Y-%I:%M%p %Z").upper()
+@lru_cache(maxsize=128)
+def _load_yaml_file(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML file; keyed on mtime so an edited file is re-read."""
+    sidecar = Path(path + ".json")
+    if _YAML_JSON_CACHE:
+        try:
+            if sidecar.stat().st_mtime_ns >= mtime_ns:
+                return json_fast.loads(sidecar.read_bytes())
+        except (FileNotFoundError, ValueError):
+            pass
+    with open(path, "rb") as f:
+        data = fast_safe_load(f)
+    if _YAML_JSON_CACHE:
+        _write_json_sidecar(sidecar, data)
+    return data
 
-def _rich_manager_name(base: str) -> str:
-    return f"{base}_v1.0_{_timestamp_str()}"
+def _load_manager_yaml(path: Path) -> Any:
+    # Deep copy: the parse is cached, and callers own the dict they get back
+    return copy.deepcopy(_load_yaml_file(str(path), os.stat(path).st_mtime_ns))
 
-def _rich_role_name(base: str) -> str:
-    return f"(R) {base}_v1.0_{_timestamp_str()}"
+# ---------- Async orchestration (backend) ----------
 
-# ---------- Prompt + examples builders ----------
+MAX_CONCURRENCY = int(os.getenv("LYZR_MAX_CONCURRENCY", "8"))
 
-def _compose_system_prompt(agent_def: Dict[str, Any]) -> str:
-    role = agent_def.get("agent_role", "").strip()
-    goal = agent_def.get("agent_goal", "").strip()
-    instr = agent_def.get("agent_instructions", "").strip()
+def _require_open(client: LyzrAPIClient) -> None:
+    # The caller owns the client's lifecycle; reopening one here would leak its pool
+    if not client.is_open:
+        raise RuntimeError("LyzrAPIClient is not open; use `async with LyzrAPIClient(...)` or call open() first")
 
-    sections = []
-    if role:
-        sections.append(f"ROLE:\n{role}")
-    if goal:
-        sections.append(f"GOAL:\n{goal}")
-    if instr:
-        sections.append(f"INSTRUCTIONS:\n{instr}")
-    return "\n\n".join(sections).strip()
+async def _create_one_role(client: LyzrAPIClient, role_def: Dict[str, Any], sem: asyncio.Semaphore, ts: str) -> Dict[str, Any] | None:
+    """Create one role agent (renamed inline); returns its summary dict or None on failure."""
+    role_name = role_def.get("name", "ROLE")
+    role_renamed = _rich_role_name(role_name, ts)
 
-def _manager_supervision_instructions(manager_def: Dict[str, Any], created_roles: List[Dict[str, Any]]) -> str:
-    base = manager_def.get("agent_instructions", "").strip()
-    lines = [base, "", "Manage these attached roles:"]
-    for r in created_roles:
-        bullets = (r.get("agent_goal") or "").strip().replace("\n", " ").strip()
-        if bullets:
-            lines.append(f"- Role '{r['name']}': {bullets}")
-        else:
-            lines.append(f"- Role '{r['name']}': Execute delegated sub-tasks from the manager.")
-    return "\n".join([l for l in lines if l]).strip()
+    # Overrides go into a new payload; the caller's role_def is left untouched
+    a_role, a_goal, a_instr = _agent_fields(role_def)
+    role_payload = {
+        **role_def,
+        "system_prompt": _compose_system_prompt(a_role, a_goal, a_instr),
+        "name": role_renamed,
+    }
+
+    logger.debug("🎭 Creating role agent → %s", role_renamed)
+    async with sem:
+        role_resp = await client.create_agent(role_payload)
+    if not role_resp.get("ok"):
+        logger.error("❌ Failed to create role %s: %s", role_renamed, role_resp)
+        return None
 
-# ---------- Main orchestration ----------
+    role_data = role_resp["data"]
+    return {
+        "id": role_data.get("agent_id") or role_data.get("_id"),
+        "name": role_renamed,
+        "description": role_def.get("description", ""),
+        "agent_role": a_role,
+        "agent_goal": a_goal,
+        "agent_instructions": a_instr,
+    }
 
 async def create_manager_with_roles(client: LyzrAPIClient, manager_yaml: Union[Path, Dict[str, Any]]) -> Dict[str, Any]:
     """
@@ -68,14 +249,17 @@ async def create_manager_with_roles(client: LyzrAPIClient, manager_yaml: Union[P
       2. Create role agents first (renamed inline)
       3. Create manager agent with rich name, linked role IDs, and updated instructions
     """
+    _require_open(client)
     try:
         logger.info("📥 Starting create_manager_with_roles orchestration")
+        # One timestamp per batch: every role and the manager share it
+        batch_ts = _timestamp_str()
 
         # 1. Load YAML if file path
         if isinstance(manager_yaml, Path):
-            logger.info(f"📂 Loading manager YAML from {manager_yaml}")
-            with open(manager_yaml, "r") as f:
-                manager_yaml = yaml.safe_load(f)
+            logger.info("📂 Loading manager YAML from %s", manager_yaml)
+            # Stat/read/parse off the event loop so concurrent requests aren't stalled
+            manager_yaml = await asyncio.to_thread(_load_manager_yaml, manager_yaml)
 
         if not isinstance(manager_yaml, dict):
             raise ValueError("manager_yaml must be a dict or Path")
@@ -84,42 +268,28 @@ async def create_manager_with_roles(client: LyzrAPIClient, manager_yaml: Union[P
         if not manager_def:
             raise ValueError("YAML must contain a top-level 'manager' key")
 
-        # 2. Create roles first
-        created_roles: List[Dict[str, Any]] = []
-        for role_def in manager_def.get("managed_agents", []):
-            role_name = role_def.get("name", "ROLE")
-            role_renamed = _rich_role_name(role_name)
-
-            role_payload = {
-                **role_def,
-                "name": role_renamed,
-                "system_prompt": _compose_system_prompt(role_def),
-            }
-
-            logger.info(f"🎭 Creating role agent → {role_renamed}")
-            role_resp = await client.create_agent(role_payload)
-            if not role_resp.get("ok"):
-                logger.error(f"❌ Failed to create role {role_renamed}: {role_resp}")
-                continue
-
-            role_data = role_resp["data"]
-            created_roles.append({
-                "id": role_data.get("agent_id") or role_data.get("_id"),
-                "name": role_renamed,
-                "description": role_payload.get("description", ""),
-                "agent_role": role_payload.get("agent_role", ""),
-                "agent_goal": role_payload.get("agent_goal", ""),
-                "agent_instructions": role_payload.get("agent_instructions", ""),
-            })
+        # 2. Create roles first (concurrently; results keep YAML order)
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
+        results = await asyncio.gather(
+            *(_create_one_role(client, role_def, sem, batch_ts) for role_def in manager_def.get("managed_agents", [])),
+            return_exceptions=True,
+        )
+        for r in results:
+            if isinstance(r, BaseException):
+                logger.error("❌ Role creation raised: %s", r)
+        created_roles: List[Dict[str, Any]] = [r for r in results if isinstance(r, dict)]
+        # One record for the whole fan-out; per-role lines are at DEBUG
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🎭 Created %d/%d role agents: %s", len(created_roles), len(results), ", ".join(r["name"] for r in created_roles))
 
         # 3. Create manager
         manager_base_name = manager_def.get("name", "MANAGER")
-        manager_renamed = _rich_manager_name(manager_base_name)
+        manager_renamed = rich_manager_name(manager_base_name, batch_ts)
 
         manager_payload = {
             **manager_def,
-            "name": manager_renamed,
             "agent_instructions": _manager_supervision_instructions(manager_def, created_roles),
+            "name": manager_renamed,
             "managed_agents": [
                 {
                     "id": r["id"],
@@ -130,10 +300,10 @@ async def create_manager_with_roles(client: LyzrAPIClient, manager_yaml: Union[P
             ],
         }
 
-        logger.info(f"👑 Creating manager agent → {manager_renamed}")
+        logger.info("👑 Creating manager agent → %s", manager_renamed)
         mgr_resp = await client.create_agent(manager_payload)
         if not mgr_resp.get("ok"):
-            logger.error(f"❌ Manager creation failed: {mgr_resp}")
+            logger.error("❌ Manager creation failed: %s", mgr_resp)
             return {"ok": False, "error": "Manager creation failed", "roles": created_roles}
 
         manager_data = mgr_resp["data"]
@@ -144,9 +314,317 @@ async def create_manager_with_roles(client: LyzrAPIClient, manager_yaml: Union[P
             "ok": True,
             "manager": manager_data,
             "roles": created_roles,
-            "timestamp": _timestamp_str(),
+            "timestamp": batch_ts,
         }
 
     except Exception as e:
         logger.exception("💥 Exception in create_manager_with_roles")
         return {"ok": False, "error": str(e)}
+
+
+# ---------- Rename-after-create orchestration (CLI) ----------
+
+_id_and_name = operator.itemgetter("id", "name")
+_USAGE_PREFIX = "Manager delegates YAML-subtasks to '"
+_USAGE_SUFFIX = "'."
+
+_UNSET = object()
+
+# Manager model config defaults, applied to the create POST. The agent PUT is a
+# partial update (the role PUT is rename-only), so the manager PUT below carries
+# just the id-dependent fields plus anything the create response did not hold.
+_MANAGER_DEFAULTS = {
+    "description": "",
+    "features": [],
+    "tools": [],
+    "llm_credential_id": "lyzr_openai",
+    "provider_id": "OpenAI",
+    "model": "gpt-4o-mini",
+    "top_p": 0.9,
+    "temperature": 0.3,
+    "response_format": {"type": "json"},
+}
+
+@lru_cache(maxsize=256)
+def _parse_role_yaml(text: str) -> Dict[str, Any]:
+    return fast_safe_load(text)
+
+def _role_def(raw: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Role definition from an inline `yaml` field: dicts (already parsed upstream)
+    are used as-is, strings are parsed once per distinct text. Returns a shallow
+    copy since callers add top-level keys.
+    """
+    return dict(raw if isinstance(raw, dict) else _parse_role_yaml(raw))
+
+async def _create_role_for_rename(
+    client: LyzrAPIClient, role: Dict[str, Any], sem: asyncio.Semaphore, ts: str
+) -> Tuple[Dict[str, Any], Dict[str, Any]] | None:
+    """
+    Create one role agent with its system_prompt + examples in the POST itself.
+    Returns (summary, updates): the PUT body carries only the id-suffixed rename
+    (plus any fields the API dropped) and is sent later by _rename_role.
+    """
+    role_yaml = _role_def(role["yaml"])
+    role_name = role_yaml.get("name", "ROLE")
+
+    # inject examples & prompt up front so creation carries them
+    role_yaml["examples"] = canonical_role_examples(role_name)
+    a_role, a_goal, a_instr = _agent_fields(role_yaml)
+    system_prompt = _compose_system_prompt(a_role, a_goal, a_instr)
+
+    logger.debug("🎭 Creating role agent: %s", role_name)
+    async with sem:
+        role_resp = await client.create_agent(build_payload(role_yaml))
+    if not role_resp.get("ok"):
+        logger.error("❌ Failed to create role %s: %s", role_name, role_resp)
+        return None
+
+    role_data = role_resp.get("data") or {}
+    role_id = role_data.get("agent_id") or role_data.get("_id")
+    if not role_id:
+        logger.error("❌ Role %s created but missing agent_id in response", role_name)
+        return None
+
+    # Rename needs the id; prompt/examples only if creation ignored them
+    role_renamed = _rich_role_name(role_name, ts, agent_id=role_id)
+    role_updates = {"name": role_renamed}
+    if "system_prompt" not in role_data:
+        role_updates["system_prompt"] = system_prompt
+    if "examples" not in role_data:
+        role_updates["examples"] = role_yaml["examples"]
+    summary = {
+        "id": role_id,
+        "name": role_renamed,  # store the final name
+        "base_name": role_name,
+        "suffix": _suffix_from_id(role_id),
+        "description": role_yaml.get("description", ""),
+        "agent_role": a_role,
+        "agent_goal": a_goal,
+        "agent_instructions": a_instr,
+    }
+    return summary, role_updates
+
+async def _rename_role(client: LyzrAPIClient, summary: Dict[str, Any], updates: Dict[str, Any], sem: asyncio.Semaphore) -> None:
+    async with sem:
+        upd = await client.update_agent(summary["id"], updates)
+    if upd.get("ok"):
+        logger.debug("✏️ Renamed role %s → %s", summary["base_name"], summary["name"])
+    else:
+        logger.warning("⚠️ PUT update failed for role %s: %s", summary["base_name"], upd)
+
+# Opt-in: point LYZR_ORCHESTRATION_CACHE at a JSON file and re-runs with an
+# unchanged manager definition return the agents created last time
+_ORCHESTRATION_CACHE = os.getenv("LYZR_ORCHESTRATION_CACHE")
+
+def _fingerprint(manager_def: Dict[str, Any], client: LyzrAPIClient) -> str | None:
+    """
+    Hash of the manager definition as loaded (before any keys are injected),
+    scoped to the client's base URL and API key so another account's agents
+    are never returned. The key itself is only hashed, never stored.
+    """
+    key_hash = hashlib.blake2b((client.api_key or "").encode("utf-8"), digest_size=16).hexdigest()
+    try:
+        blob = json_fast.dumps([client.base_url, key_hash, manager_def], sort_keys=True)
+    except TypeError:
+        # Non-JSON values (e.g. YAML timestamps without orjson) -> no caching
+        return None
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+def _read_orchestration_cache() -> Dict[str, Any]:
+    try:
+        with open(_ORCHESTRATION_CACHE, "rb") as f:
+            return json_fast.loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+_CACHE_THREAD_LOCK = threading.Lock()
+
+@contextmanager
+def _orchestration_cache_lock(path: Path):
+    """Serialize read-modify-write of the cache file across threads and processes."""
+    with _CACHE_THREAD_LOCK, open(path.with_name(path.name + ".lock"), "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+def _write_orchestration_cache(fingerprint: str, result: Dict[str, Any]) -> None:
+    path = Path(_ORCHESTRATION_CACHE)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _orchestration_cache_lock(path):
+        cache = _read_orchestration_cache()
+        cache[fingerprint] = result
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_fast.dumps(cache, indent=True))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+async def create_manager_and_attach_roles(client: LyzrAPIClient, manager_yaml: Union[Path, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Create role agents first, then manager, then:
+      - rename both with PST timestamp and id suffix,
+      - attach roles to manager (managed_agents + usage_description),
+      - backfill system_prompt & examples via a partial PUT only if creation dropped them.
+    """
+    _require_open(client)
+
+    # Load YAML if a path was received
+    if isinstance(manager_yaml, Path):
+        manager_yaml = await asyncio.to_thread(_load_manager_yaml, manager_yaml)
+
+    if not isinstance(manager_yaml, dict):
+        raise ValueError("manager_yaml must be a dict or Path")
+
+    manager_def = manager_yaml.get("manager")
+    if not manager_def:
+        raise ValueError("YAML must contain a top-level 'manager' key")
+
+    fingerprint = _fingerprint(manager_def, client) if _ORCHESTRATION_CACHE else None
+    if fingerprint:
+        cached = (await asyncio.to_thread(_read_orchestration_cache)).get(fingerprint)
+        if cached:
+            logger.info("♻️ Unchanged manager definition; reusing %s (%s)", cached["name"], cached["agent_id"])
+            return cached
+
+    # One timestamp per batch: every role and the manager share it
+    batch_ts = _timestamp_str()
+
+    # ----- Create roles first (concurrently; results keep YAML order) -----
+    roles = []
+    for role in manager_def.get("managed_agents", []):
+        if "yaml" in role:
+            roles.append(role)
+        else:
+            logger.warning("⚠️ Skipping role %s (no inline YAML)", role.get("name"))
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    results = await asyncio.gather(
+        *(_create_role_for_rename(client, role, sem, batch_ts) for role in roles),
+        return_exceptions=True,
+    )
+    for r in results:
+        if isinstance(r, BaseException):
+            logger.error("❌ Role creation raised: %s", r)
+    created = [r for r in results if isinstance(r, tuple)]
+    created_roles: List[Dict[str, Any]] = [summary for summary, _ in created]
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("🎭 Created %d/%d role agents: %s", len(created_roles), len(roles), ", ".join(r["name"] for r in created_roles))
+
+    # ----- Create manager -----
+    manager_base_name = manager_def.get("name", "MANAGER")
+    # Build enhanced instructions to include supervision lines
+    mgr_instr_with_supervision = _manager_supervision_instructions(manager_def, created_roles)
+
+    # Also set examples (manager + roles). Both go into the POST itself, so the
+    # follow-up PUT only has to carry what needs the ids (name, managed_agents).
+    # Both go on a copy; manager_def stays as the caller passed it
+    mgr_examples = canonical_manager_examples(manager_base_name, tuple(r["base_name"] for r in created_roles))
+    manager_payload = build_payload({
+        **_MANAGER_DEFAULTS,
+        **manager_def,
+        "examples": mgr_examples,
+        "agent_instructions": mgr_instr_with_supervision,
+    })
+
+    # Role renames don't feed the manager POST (its payload only needs the base
+    # names), so they go out alongside it instead of gating it
+    logger.info("👑 Creating manager agent: %s", manager_base_name)
+    mgr_resp, *rename_results = await asyncio.gather(
+        client.create_agent(manager_payload),
+        *(_rename_role(client, summary, updates, sem) for summary, updates in created),
+        return_exceptions=True,
+    )
+    for r in rename_results:
+        if isinstance(r, BaseException):
+            logger.error("❌ Role rename raised: %s", r)
+    if isinstance(mgr_resp, BaseException):
+        raise mgr_resp
+    if not mgr_resp.get("ok"):
+        logger.error("❌ Manager creation failed: %s", mgr_resp)
+        return {}
+
+    mgr_data = mgr_resp.get("data") or {}
+    manager_id = mgr_data.get("agent_id") or mgr_data.get("_id")
+    if not manager_id:
+        logger.error("❌ Manager created but missing agent_id in response")
+        return {}
+
+    # Rename + attach roles + set prompts/examples
+    manager_renamed = rich_manager_name(manager_base_name, batch_ts, agent_id=manager_id)
+
+    # Manager managed_agents payload with usage descriptors
+    managed_agents_payload = [
+        {"id": role_id, "name": name, "usage_description": _USAGE_PREFIX + name + _USAGE_SUFFIX}
+        for role_id, name in map(_id_and_name, created_roles)
+    ]
+
+    m_role, m_goal, _ = _agent_fields(manager_def)
+    desired = {
+        "name": manager_renamed,
+        "system_prompt": _compose_system_prompt(m_role, m_goal, mgr_instr_with_supervision),
+        "examples": mgr_examples,
+        # best-effort backfill of POST fields the API may have dropped
+        "agent_role": m_role,
+        "agent_goal": m_goal,
+        "agent_instructions": mgr_instr_with_supervision,
+        **{k: manager_payload[k] for k in _MANAGER_DEFAULTS},
+    }
+    # association; an empty list would overwrite roles already attached server-side
+    if managed_agents_payload:
+        desired["managed_agents"] = managed_agents_payload
+    # Partial PUT: skip fields the create response already holds with the same value
+    manager_updates = {k: v for k, v in desired.items() if mgr_data.get(k, _UNSET) != v}
+    mgr_upd = await client.update_agent(manager_id, manager_updates) if manager_updates else {"ok": True}
+    if not mgr_upd.get("ok"):
+        logger.warning("⚠️ PUT update failed for manager %s: %s", manager_base_name, mgr_upd)
+
+    result = {
+        "agent_id": manager_id,
+        "name": manager_renamed,
+        "roles": created_roles,
+        "timestamp": batch_ts,
+    }
+    # Only remember complete runs, so a partial failure is retried next time
+    if fingerprint and mgr_upd.get("ok") and len(created_roles) == len(roles):
+        await asyncio.to_thread(_write_orchestration_cache, fingerprint, result)
+    return result
+
+
+async def _main(manager_path: Path) -> Dict[str, Any]:
+    async with LyzrAPIClient(timeout=180) as client:
+        return await create_manager_and_attach_roles(client, manager_path)
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python -m scripts.create_manager_with_roles <manager_yaml_file>")
+        sys.exit(1)
+
+    logging.basicConfig(format="%(message)s")
+    # Quiet batch runs with LYZR_LOG_LEVEL=WARNING; message args are only formatted when emitted.
+    # Set here, not at import, so the backend's own logging config is left alone.
+    level = "DEBUG" if os.getenv("LYZR_DEBUG", "0") == "1" else os.getenv("LYZR_LOG_LEVEL", "INFO").upper()
+    try:
+        logger.setLevel(level)
+    except ValueError:
+        logger.setLevel(logging.INFO)
+        logger.warning("⚠️ Unknown LYZR_LOG_LEVEL %r; using INFO", level)
+    result = asyncio.run(_main(Path(sys.argv[1])))
+    if not result:
+        sys.exit(1)
+    logger.info("✅ Manager %s → %s (%d roles)", result["name"], result["agent_id"], len(result["roles"]))
+
+if __name__ == "__main__":
+    main()
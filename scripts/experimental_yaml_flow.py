@@ -1,7 +1,7 @@
 import os
 import sys
 import json
-import yaml
+from src.utils.yaml_fast import fast_safe_load
 from pathlib import Path
 from datetime import datetime
 
@@ -19,7 +19,7 @@ def create_manager_from_yaml(client: LyzrAPIClient, manager_yaml_path: str):
 
 def run_inference(client: LyzrAPIClient, agent_id: str, usecase_file: str):
     with open(usecase_file, "r") as f:
-        usecase_yaml = yaml.safe_load(f)
+        usecase_yaml = fast_safe_load(f)
 
     usecase_text = usecase_yaml.get("use_case") or usecase_yaml.get("description")
     if not usecase_text:
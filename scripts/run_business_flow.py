@@ -5,8 +5,13 @@ import yaml
 import httpx
 import json
 from pathlib import Path
-from datetime import datetime
-import pytz  # pip install pytz
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 
 # ---------- Config / Time Helpers ----------
@@ -14,13 +19,13 @@ import pytz  # pip install pytz
 def load_llm_config():
     cfg_path = Path("config/llm_config.yaml")
     with open(cfg_path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoader)
 
 def now_in_tz(tz_name: str):
     try:
-        tz = pytz.timezone(tz_name)
-    except Exception:
-        tz = pytz.UTC
+        tz = ZoneInfo(tz_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        tz = timezone.utc
     return datetime.now(tz)
 
 def stamp_for_name(dt: datetime) -> str:
@@ -180,7 +185,7 @@ def main():
     config = load_llm_config()
 
     with open(yaml_path, "r") as f:
-        business_yaml = yaml.safe_load(f)
+        business_yaml = yaml.load(f, Loader=_SafeLoader)
 
     api_key = os.getenv("LYZR_API_KEY")
     if not api_key:
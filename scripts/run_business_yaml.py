@@ -4,11 +4,16 @@ import yaml
 import httpx
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 def load_llm_config():
     """Load config/llm_config.yaml"""
     config_path = Path("config/llm_config.yaml")
     with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoader)
 
 def build_system_prompt(agent: dict) -> str:
     """Combine role, goal, and instructions into system_prompt."""
@@ -50,7 +55,7 @@ def main():
     # --- Load Business YAML ---
     yaml_path = Path("agents/managers/KYC_Onboarding_Flow.yaml")
     with open(yaml_path, "r") as f:
-        business_yaml = yaml.safe_load(f)
+        business_yaml = yaml.load(f, Loader=_SafeLoader)
 
     api_key = os.getenv("LYZR_API_KEY")
     base_url = os.getenv("LYZR_BASE_URL", "https://agent-prod.studio.lyzr.ai/v3/agents/")
@@ -4,7 +4,7 @@ import json
 import time
 from pathlib import Path
 from datetime import datetime
-import yaml
+from src.utils.yaml_fast import fast_safe_load
 
 from src.api.client import LyzrAPIClient
 from src.services.agent_manager import AgentManager
@@ -92,7 +92,7 @@ def main():
 
     # Load use cases
     with open(usecases_file, "r") as f:
-        usecases = yaml.safe_load(f)
+        usecases = fast_safe_load(f)
 
     # Run inference per use case
     out_root = Path("output") / Path(manager_yaml_path).stem
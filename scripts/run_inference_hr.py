@@ -1,7 +1,7 @@
 import os
 import sys
 import json
-import yaml
+from src.utils.yaml_fast import fast_safe_load
 from pathlib import Path
 
 from scripts.run_inference import run_inference  # reuse your existing function
@@ -13,7 +13,7 @@ from scripts.run_inference import run_inference  # reuse your existing function
 def load_usecase(path: str) -> str:
     """Flatten a use case YAML into a single string message for inference."""
     with open(path, "r") as f:
-        uc = yaml.safe_load(f)
+        uc = fast_safe_load(f)
 
     # Build human-readable message
     message = []
@@ -1,7 +1,7 @@
 # scripts/run_use_cases.py
 
 import os
-import yaml
+from src.utils.yaml_fast import fast_safe_load, fast_safe_dump
 import json
 import httpx
 from pathlib import Path
@@ -70,7 +70,7 @@ def call_agent(agent_id: str, session_id: str, message: str):
         return json.loads(raw_response)
     except Exception:
         try:
-            return yaml.safe_load(raw_response)
+            return fast_safe_load(raw_response)
         except Exception:
             return {"raw_response": raw_response}
 
@@ -82,7 +82,7 @@ def save_workflow(use_case_name: str, content: dict):
     out_file = out_dir / "workflow.yaml"
 
     with open(out_file, "w") as f:
-        yaml.safe_dump(content, f, sort_keys=False)
+        fast_safe_dump(content, f, sort_keys=False)
 
     print(f"✅ Saved workflow for {use_case_name} → {out_file}")
 
@@ -93,7 +93,7 @@ def main():
 
     # Load use cases
     with open("agents/use_cases.yaml", "r") as f:
-        use_cases = yaml.safe_load(f)["use_cases"]
+        use_cases = fast_safe_load(f)["use_cases"]
 
     # Iterate through use cases
     for i, case in enumerate(use_cases, 1):
@@ -1,6 +1,6 @@
 import os
 import sys
-import yaml
+from src.utils.yaml_fast import fast_safe_load
 from pathlib import Path
 
 from src.api.client import LyzrAPIClient
@@ -14,13 +14,13 @@ def main():
     manager = AgentManager(client)
 
     with open("UPDATEME.yaml", "r") as f:
-        config = yaml.safe_load(f)
+        config = fast_safe_load(f)
 
     actions = config.get("actions", {})
     if actions.get("create_agents", {}).get("enabled"):
         for fpath in actions["create_agents"]["files"]:
             with open(fpath, "r") as f:
-                content = yaml.safe_load(f)
+                content = fast_safe_load(f)
 
             is_manager = (
                 "mgr" in Path(fpath).name.lower()
@@ -6,14 +6,19 @@ import yaml
 import uuid
 import httpx
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 # ------------------------------------------------------------------------------
 # Utilities
 # ------------------------------------------------------------------------------
 
 def to_pst_str() -> str:
-    pst = pytz.timezone("America/Los_Angeles")
+    pst = ZoneInfo("America/Los_Angeles")
     return datetime.now(pst).strftime("%Y-%m-%d %I:%M %p %Z")
 
 def timestamp_str() -> str:
@@ -21,7 +26,7 @@ def timestamp_str() -> str:
 
 def load_yaml(path: str) -> dict:
     with open(path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoader)
 
 def save_json(data: dict, path: str):
     os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -1,10 +1,9 @@
 # scripts/workflow_create.py
 
 import os
-import yaml
+from src.utils.yaml_fast import fast_safe_load
 from pathlib import Path
 from datetime import datetime
-import pytz
 import argparse
 
 from src.api.client import LyzrAPIClient
@@ -17,7 +16,7 @@ def create_agent_workflow(yaml_path: str, client: LyzrAPIClient, debug: bool = F
 
     yaml_path = Path(yaml_path)
     with open(yaml_path, "r") as f:
-        content = yaml.safe_load(f)
+        content = fast_safe_load(f)
 
     is_manager = (
         "mgr" in yaml_path.name.lower()
@@ -4,34 +4,31 @@ import os
 import httpx
 import asyncio
 import logging
-from datetime import datetime
-import pytz
 
 from src.utils.payload_normalizer import normalize_payload
 from src.utils.normalize_output import canonicalize_name
+from src.utils import json_fast
+from src.utils.timestamps import timestamp_str as _timestamp_str, rich_manager_name
 
 logger = logging.getLogger("lyzr-client")
 
-# -----------------------------
-# Timezone utilities
-# -----------------------------
-def _tz() -> pytz.timezone:
-    tz_name = os.getenv("APP_TZ", "America/Los_Angeles")
-    try:
-        return pytz.timezone(tz_name)
-    except Exception:
-        return pytz.timezone("America/Los_Angeles")
-
-def _timestamp_str() -> str:
-    now = datetime.now(_tz())
-    return now.strftime("%d%b%Y-%I:%M%p %Z").upper()
-
-def _suffix_from_id(agent_id: str) -> str:
-    return (agent_id or "")[-6:] or "XXXXXX"
+# HTTP/2 lets concurrent requests (e.g. gathered role creation) multiplex over one
+# connection; it needs the optional `h2` package (pip install "httpx[http2]").
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
-def _rich_manager_name(base: str, agent_id: str) -> str:
-    return f"{base}_v1.0_{_suffix_from_id(agent_id)}_{_timestamp_str()}"
+# Pool size for the whole client, independent of the per-run LYZR_MAX_CONCURRENCY
+# semaphore: the backend shares one client per API key across concurrent requests.
+# Defaults match httpx's own limits.
+MAX_CONNECTIONS = int(os.getenv("LYZR_HTTP_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LYZR_HTTP_MAX_KEEPALIVE", "20"))
 
+# Per-call cap on concurrent role POSTs; the pool limits don't bound a fan-out
+# once HTTP/2 multiplexes it over a single connection
+MAX_CONCURRENCY = int(os.getenv("LYZR_MAX_CONCURRENCY", "8"))
 
 # -----------------------------
 # Client
@@ -50,41 +47,67 @@ class LyzrAPIClient:
         self.timeout = timeout
         self._client: httpx.AsyncClient | None = None
 
-    # --- Context manager support ---
-    async def __aenter__(self):
-        self._client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True)
+    # --- Lifecycle ---
+    def open(self) -> "LyzrAPIClient":
+        """Create the pooled HTTP client if not already open (for long-lived reuse)."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                http2=_HTTP2,
+                # Hold idle connections for a minute (httpx default is 5s) so PUTs that
+                # follow a slow create/inference call still reuse the TLS session
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=60,
+                ),
+            )
         return self
 
-    async def __aexit__(self, exc_type, exc, tb):
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None
+
+    async def aclose(self):
         if self._client:
             await self._client.aclose()
+            self._client = None
+
+    # --- Context manager support ---
+    async def __aenter__(self):
+        return self.open()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
 
     # --- Core HTTP helpers ---
+    # Bodies are pre-encoded with orjson (json_fast) and sent as bytes; _headers sets the JSON content type.
     async def get(self, path: str, api_key: str | None = None):
         url = self._normalize_url(path)
         try:
             resp = await self._client.get(url, headers=self._headers(api_key))
             return self._handle_response(resp)
         except Exception as e:
-            logger.error(f"❌ GET {url} failed: {e}")
+            logger.error("❌ GET %s failed: %s", url, e)
             return {"ok": False, "error": str(e)}
 
     async def post(self, path: str, payload: dict, api_key: str | None = None):
         url = self._normalize_url(path)
         try:
-            resp = await self._client.post(url, headers=self._headers(api_key), json=payload)
+            resp = await self._client.post(url, headers=self._headers(api_key), content=json_fast.dumps(payload))
             return self._handle_response(resp)
         except Exception as e:
-            logger.error(f"❌ POST {url} failed: {e}")
+            logger.error("❌ POST %s failed: %s", url, e)
             return {"ok": False, "error": str(e)}
 
     async def put(self, path: str, payload: dict, api_key: str | None = None):
         url = self._normalize_url(path)
         try:
-            resp = await self._client.put(url, headers=self._headers(api_key), json=payload)
+            resp = await self._client.put(url, headers=self._headers(api_key), content=json_fast.dumps(payload))
             return self._handle_response(resp)
         except Exception as e:
-            logger.error(f"❌ PUT {url} failed: {e}")
+            logger.error("❌ PUT %s failed: %s", url, e)
             return {"ok": False, "error": str(e)}
 
     # --- API Wrappers ---
@@ -125,11 +148,16 @@ class LyzrAPIClient:
                 })
 
         manager_renamed = manager_base_name
+        ts = None
         if rename_manager:
-            manager_renamed = _rich_manager_name(manager_base_name, manager_id)
+            # One timestamp for the new name and the returned "timestamp" field
+            ts = _timestamp_str()
+            manager_renamed = rich_manager_name(manager_base_name, ts, agent_id=manager_id)
 
-        update_payload = {**manager_data, "name": manager_renamed, "managed_agents": existing_roles}
-        upd_resp = await self.update_agent(manager_id, update_payload, api_key=api_key)
+        # manager_data is our own parsed response; patch it instead of copying it
+        manager_data["name"] = manager_renamed
+        manager_data["managed_agents"] = existing_roles
+        upd_resp = await self.update_agent(manager_id, manager_data, api_key=api_key)
 
         if upd_resp.get("ok"):
             return {
@@ -138,49 +166,58 @@ class LyzrAPIClient:
                 "renamed": manager_renamed if rename_manager else None,
                 "manager": upd_resp.get("data"),
                 "roles": existing_roles,
-                "timestamp": _timestamp_str() if rename_manager else None,
+                "timestamp": ts,
             }
         return {"ok": False, "linked": False, "error": upd_resp.get("error")}
 
     async def create_manager_with_roles(self, manager_def: dict, api_key: str | None = None):
         """
         Create a manager agent and its managed role agents.
-        Always PUT full payload back so no fields are lost.
+        The linking PUT body is built locally (no GET): the normalize_payload output
+        overlaid with the POST response, plus the created roles. It is not a full
+        round-trip of the stored agent: `tools` is re-sent as [], `features` only
+        when `features_safe` is set, and server-side defaults that the POST
+        response omits are not carried over.
         """
         if not isinstance(manager_def, dict):
             return {"ok": False, "error": "Manager definition must be dict"}
 
         created_roles = []
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
 
-        # 1. Create roles
-        for entry in manager_def.get("managed_agents", []):
+        async def _create_role(entry: dict):
             try:
-                role_payload = normalize_payload(entry)
-                role_resp = await self.create_agent(role_payload, api_key=api_key)
-                if role_resp.get("ok"):
-                    created_roles.append(role_resp["data"])
+                async with sem:
+                    role_resp = await self.create_agent(normalize_payload(entry), api_key=api_key)
+                return role_resp["data"] if role_resp.get("ok") else None
             except Exception as e:
-                logger.error(f"❌ Failed to create role: {e}")
+                logger.error("❌ Failed to create role: %s", e)
+                return None
 
         try:
-            # 2. Create manager
+            # 1+2. Roles and the manager don't depend on each other until linking,
+            #      so creation POSTs go out concurrently (roles capped by sem)
             manager_payload = normalize_payload(manager_def)
-            mgr_resp = await self.create_agent(manager_payload, api_key=api_key)
+            mgr_resp, *role_results = await asyncio.gather(
+                self.create_agent(manager_payload, api_key=api_key),
+                *(_create_role(entry) for entry in manager_def.get("managed_agents", [])),
+            )
+            created_roles = [r for r in role_results if r is not None]
             if not mgr_resp.get("ok"):
                 return {"ok": False, "error": mgr_resp.get("error"), "roles": created_roles}
 
             manager = mgr_resp["data"]
 
-            # 3. Link roles back into manager
+            # 3. Link roles back into manager (body built locally from what we just
+            #    sent + the POST response; see the docstring for what it omits)
             if created_roles:
-                mgr_fetched = await self.get(f"/v3/agents/{manager['id']}/", api_key=api_key)
-                if not mgr_fetched.get("ok"):
-                    return {"ok": False, "error": f"Failed to fetch created manager: {mgr_fetched}"}
-
-                manager_data = mgr_fetched["data"]
-                manager_data["managed_agents"] = (manager_data.get("managed_agents") or []) + created_roles
+                # manager_payload was built by normalize_payload and is already sent,
+                # so it can be patched in place rather than spread into a new dict
+                managed = (manager_payload.get("managed_agents") or []) + created_roles
+                manager_payload.update(manager)
+                manager_payload["managed_agents"] = managed
 
-                upd_resp = await self.update_agent(manager["id"], manager_data, api_key=api_key)
+                upd_resp = await self.update_agent(manager["id"], manager_payload, api_key=api_key)
                 if upd_resp.get("ok"):
                     manager = upd_resp["data"]
 
@@ -206,10 +243,10 @@ class LyzrAPIClient:
     def _handle_response(self, resp: httpx.Response):
         try:
             resp.raise_for_status()
-            return {"ok": True, "data": resp.json()}
+            return {"ok": True, "data": json_fast.loads(resp.content)}
         except Exception as e:
-            logger.error(f"❌ API error {resp.status_code}: {e}")
+            logger.error("❌ API error %s: %s", resp.status_code, e)
             try:
-                return {"ok": False, "error": resp.json()}
+                return {"ok": False, "error": json_fast.loads(resp.content)}
             except Exception:
                 return {"ok": False, "error": str(e)}
@@ -1,12 +1,11 @@
 # /src/services/agent_manager.py
 
 import sys
-import yaml
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
 from tzlocal import get_localzone
 
 from src.api.client import LyzrAPIClient
+from src.utils.yaml_fast import fast_safe_load
 from src.utils.payload_normalizer import normalize_payload
 from src.utils.versioning import generate_new_name  # fully centralized naming
 from src.utils.output_saver import save_output
@@ -20,7 +19,7 @@ class AgentManager:
         try:
             self.local_tz = get_localzone()
         except Exception:
-            self.local_tz = pytz.UTC
+            self.local_tz = timezone.utc
 
     # -------------------------------------------------------------------------
     # Helpers
@@ -78,7 +77,7 @@ class AgentManager:
     def _create_role_agent(self, role_yaml_path: str, existing_agents: list, usage_description: str = "") -> dict:
         """Helper to create a single role agent from YAML."""
         with open(role_yaml_path, "r") as rf:
-            role_yaml = yaml.safe_load(rf)
+            role_yaml = fast_safe_load(rf)
 
         role_payload = normalize_payload(role_yaml)
         if "system_prompt" not in role_payload:
@@ -115,7 +114,7 @@ class AgentManager:
         then assign roles.
         """
         with open(manager_yaml_path, "r") as f:
-            manager_yaml = yaml.safe_load(f)
+            manager_yaml = fast_safe_load(f)
 
         resolved_agents = []
         existing_agents = self._get_existing_agents()
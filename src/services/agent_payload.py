@@ -0,0 +1,103 @@
+# src/services/agent_payload.py
+# Single source for mapping an agent YAML definition to the POST /v3/agents/ payload,
+# plus the create/update calls built on it (scripts/create_agent_from_yaml is a CLI shim).
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Union
+
+from src.utils.yaml_fast import fast_safe_load
+
+if TYPE_CHECKING:
+    from src.api.client import LyzrAPIClient
+
+_PROMPT_SECTIONS = (
+    ("ROLE", "agent_role"),
+    ("GOAL", "agent_goal"),
+    ("INSTRUCTIONS", "agent_instructions"),
+)
+
+_LLM_DEFAULTS = {
+    "provider_id": "OpenAI",
+    "model": "gpt-4o-mini",
+    "temperature": 0.7,
+    "top_p": 0.9,
+    "llm_credential_id": "lyzr_openai",
+}
+
+
+def to_system_prompt(agent_def: Dict[str, Any]) -> str:
+    """Compose a robust system prompt from role/goal/instructions."""
+    return "\n\n".join(
+        f"{label}:\n{agent_def[key]}" for label, key in _PROMPT_SECTIONS if agent_def.get(key)
+    ).strip()
+
+
+def build_payload(agent_def: Dict[str, Any], include_system_prompt: bool = True) -> Dict[str, Any]:
+    """Map a parsed agent definition to the creation payload the API accepts."""
+    # Resolve llm_config against defaults once instead of per field.
+    llm = {**_LLM_DEFAULTS, **(agent_def.get("llm_config") or {})}
+
+    # Map to creation payload the API accepts.
+    return {
+        "template_type": agent_def.get("template_type", "single_task"),
+        "name": agent_def["name"],
+        "description": agent_def.get("description", ""),
+        # Many Lyzr deployments store prompt in `system_prompt`. We still pass the named fields,
+        # but build `system_prompt` so it always survives.
+        "system_prompt": to_system_prompt(agent_def) if include_system_prompt else "",
+        "agent_role": agent_def.get("agent_role", ""),
+        "agent_goal": agent_def.get("agent_goal", ""),
+        "agent_instructions": agent_def.get("agent_instructions", ""),
+        "examples": agent_def.get("examples"),  # Some deployments accept this at creation; if not, we PUT it later.
+        "features": agent_def.get("features", []),
+        # Some envs use singular "tool", others array "tools"; we’ll pass both if present.
+        "tools": agent_def.get("tools", []),
+        "tool": agent_def.get("tool"),
+        "tool_usage_description": agent_def.get("tool_usage_description", "{}"),
+        "response_format": agent_def.get("response_format", {"type": "json"}),
+        "provider_id": agent_def.get("provider_id") or llm["provider_id"],
+        "model": agent_def.get("model") or llm["model"],
+        "temperature": agent_def.get("temperature", llm["temperature"]),
+        "top_p": agent_def.get("top_p", llm["top_p"]),
+        "llm_credential_id": agent_def.get("llm_credential_id", llm["llm_credential_id"]),
+        "version": str(agent_def.get("version", "3")),
+    }
+
+
+def create_agent_from_yaml(client: LyzrAPIClient, agent_yaml: Union[Path, Dict[str, Any], str]) -> Dict[str, Any]:
+    """
+    Create an agent using POST /v3/agents/.
+    Accepts a dict, a Path to a YAML file, or YAML text. Returns the raw API response.
+    """
+    if isinstance(agent_yaml, Path):
+        with open(agent_yaml, "rb") as f:
+            agent_def = fast_safe_load(f)
+    elif isinstance(agent_yaml, str):
+        agent_def = fast_safe_load(agent_yaml)
+    else:
+        agent_def = dict(agent_yaml)
+
+    payload = build_payload(agent_def)
+
+    print(f"⚙️ Creating agent: {payload['name']}")
+    resp = client._request("POST", "/v3/agents/", payload=payload)
+
+    if resp.get("ok"):
+        agent_id = (resp.get("data") or {}).get("agent_id", "unknown")
+        print(f"✅ Created agent {payload['name']} → {agent_id}")
+    else:
+        print(f"❌ Failed to create agent: {payload['name']}")
+        print(resp)
+
+    return resp
+
+
+def update_agent(client: LyzrAPIClient, agent_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    PUT /v3/agents/{agent_id}
+    Use to rename, attach managed agents, set system_prompt/examples, etc.
+    """
+    print(f"🛠️ Updating agent {agent_id} with: {list(updates.keys())}")
+    return client._request("PUT", f"/v3/agents/{agent_id}", payload=updates)
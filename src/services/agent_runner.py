@@ -4,7 +4,7 @@ import json
 import time
 from pathlib import Path
 from datetime import datetime
-import yaml
+from src.utils.yaml_fast import fast_safe_load
 
 from src.api.client import LyzrAPIClient
 from src.services.agent_manager import AgentManager
@@ -38,7 +38,7 @@ def create_and_run(manager_yaml: str, usecases_file: str,
 
     # Load use cases
     with open(usecases_file, "r") as f:
-        usecases = yaml.safe_load(f)
+        usecases = fast_safe_load(f)
 
     out_root = Path("output") / Path(manager_yaml).stem
     all_results = []
@@ -1,13 +1,22 @@
 # src/services/create_from_yaml.py
 
 import os
-import yaml
+import re
 from pathlib import Path
 
 from src.api.client import LyzrAPIClient
 from src.services.agent_manager import AgentManager
 from scripts.create_agent import create_agent
 
+# Top-level (unindented) `managed_agents:` key — enough to classify a manager file
+_MANAGED_AGENTS_RE = re.compile(r"^managed_agents\s*:", re.MULTILINE)
+
+
+def _has_managed_agents(fpath: str) -> bool:
+    """Scan the raw text for a top-level managed_agents key without a full YAML parse."""
+    with open(fpath, "r") as f:
+        return _MANAGED_AGENTS_RE.search(f.read()) is not None
+
 
 def create_agent_from_yaml(fpath: str, debug: bool = None):
     """
@@ -20,15 +29,12 @@ def create_agent_from_yaml(fpath: str, debug: bool = None):
     client = LyzrAPIClient(debug=debug)
     manager = AgentManager(client)
 
-    # Load YAML
-    with open(fpath, "r") as f:
-        content = yaml.safe_load(f)
-
-    # Detect if this is a Manager agent
+    # Detect if this is a Manager agent (filename first; the callee does the full parse)
+    fname = Path(fpath).name.lower()
     is_manager = (
-        "mgr" in Path(fpath).name.lower()
-        or "manager" in Path(fpath).name.lower()
-        or "managed_agents" in content
+        "mgr" in fname
+        or "manager" in fname
+        or _has_managed_agents(fpath)
     )
 
     if is_manager:
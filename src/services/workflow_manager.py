@@ -1,6 +1,6 @@
 # src/services/workflow_manager.py
 
-import yaml
+from src.utils.yaml_fast import fast_safe_load
 from src.api.client import LyzrAPIClient
 
 
@@ -16,7 +16,7 @@ def create_workflow_from_yaml(client: LyzrAPIClient, yaml_path: str):
         dict: API response from workflow creation
     """
     with open(yaml_path, "r") as f:
-        workflow_dict = yaml.safe_load(f)
+        workflow_dict = fast_safe_load(f)
 
     # Ensure required keys
     if "flow_name" not in workflow_dict or "flow_data" not in workflow_dict:
@@ -42,7 +42,8 @@ def get_current_user(token: HTTPAuthorizationCredentials = Depends(security)) ->
             algorithms=[JWT_ALGORITHM],
             options={"verify_aud": False}  # Supabase tokens often omit audience
         )
-        return UserClaims(
+        # Claims were just verified above, so skip re-validation on construction
+        return UserClaims.model_construct(
             sub=payload.get("sub", ""),
             email=payload.get("email", payload.get("user_metadata", {}).get("email", "")),
             role=payload.get("role", "authenticated"),
@@ -1,4 +1,4 @@
-import yaml
+from src.utils.yaml_fast import fast_safe_load
 import os
 
 CONFIG_PATH = os.path.join(
@@ -7,7 +7,7 @@ CONFIG_PATH = os.path.join(
 
 def load_llm_config():
     with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return fast_safe_load(f)
 
 def get_default_params():
     cfg = load_llm_config()
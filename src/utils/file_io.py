@@ -1,5 +1,6 @@
 import json
 import yaml
+from src.utils.yaml_fast import fast_safe_load
 from pathlib import Path
 
 
@@ -8,7 +9,7 @@ def save_yaml_file(path: Path, yaml_str: str):
     Try to safely dump YAML. If parsing fails, fall back to raw text.
     """
     try:
-        parsed = yaml.safe_load(yaml_str)
+        parsed = fast_safe_load(yaml_str)
         with open(path, "w") as f:
             yaml.dump(
                 parsed,
@@ -0,0 +1,28 @@
+# src/utils/json_fast.py
+# orjson-backed JSON helpers, falling back to stdlib json when orjson isn't installed.
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """Parse JSON from str or bytes (orjson takes bytes directly, no decode step)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes; `indent=True` matches json.dumps(indent=2)."""
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    # Compact separators when not indenting, matching orjson's output
+    separators = None if indent else (",", ":")
+    return json.dumps(
+        obj, indent=2 if indent else None, separators=separators, sort_keys=sort_keys, ensure_ascii=False
+    ).encode("utf-8")
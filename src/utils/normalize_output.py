@@ -1,10 +1,9 @@
-import json
-import yaml
+from src.utils.yaml_fast import fast_safe_load, fast_safe_dump
 import ast
 import re
-import shutil
 from pathlib import Path
 from datetime import datetime
+from src.utils import json_fast
 
 # Default config used if LLM details are not specified in the YAML
 DEFAULT_LLM_CONFIG = {
@@ -15,19 +14,18 @@ DEFAULT_LLM_CONFIG = {
     "response_format": {"type": "json"},
 }
 
+_NAME_SANITIZE = str.maketrans({" ": "_", "-": "_"})
+
+
 def canonicalize_name(name: str) -> str:
     """Preserve input casing, only make it filesystem-safe."""
-    return (
-        name.strip()
-            .replace(" ", "_")
-            .replace("-", "_")
-    )
+    return name.strip().translate(_NAME_SANITIZE)
 
 
 def canonicalize_agent_yaml(agent: dict) -> dict:
     """Return canonical agent dict (not string yet)."""
     try:
-        parsed = yaml.safe_load(agent.get("yaml", "")) or {}
+        parsed = fast_safe_load(agent.get("yaml", "")) or {}
     except Exception:
         parsed = {"name": agent.get("name", "unnamed_agent")}
 
@@ -57,6 +55,44 @@ def canonicalize_agent_yaml(agent: dict) -> dict:
     return canonical
 
 
+# Raw newlines inside JSON strings: drop CRs and escape LFs in one pass
+_ESCAPE_NEWLINES = str.maketrans({"\r": None, "\n": "\\n"})
+
+# JSON string escapes, decoded in one regex pass (unlike unicode_escape, keeps UTF-8 text intact)
+_UNESCAPE_RE = re.compile(r'\\(?:(["\\/bfnrt])|u([0-9a-fA-F]{4}))')
+_UNESC = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+def _unescape(s: str) -> str:
+    return _UNESCAPE_RE.sub(lambda m: _UNESC[m[1]] if m[1] else chr(int(m[2], 16)), s)
+
+
+def _safe_json(s):
+    try:
+        return json_fast.loads(s)
+    except ValueError:
+        return None
+
+
+def _parse_response(text: str):
+    """
+    Parse an LLM response body, picking the strategy from the first non-space char:
+    '{' → JSON object (retrying with raw newlines escaped), '"' → string-wrapped JSON.
+    Anything else isn't JSON, so it returns None without attempting a parse.
+    """
+    s = text.lstrip()
+    first = s[:1]
+    if first == "{":
+        parsed = _safe_json(s)
+        if parsed is None:
+            parsed = _safe_json(s.translate(_ESCAPE_NEWLINES))
+        return parsed
+    if first == '"':
+        inner = _safe_json(s)
+        return _safe_json(inner) if isinstance(inner, str) else None
+    return None
+
+
 def normalize_inference_output(raw_response: str, out_dir: Path, max_attempts: int = 5):
     """
     Robust normalizer with canonical YAML saving.
@@ -65,27 +101,13 @@ def normalize_inference_output(raw_response: str, out_dir: Path, max_attempts: i
     - Updates Manager YAMLs with managed_agents pointing to canonical paths
     """
 
-    def safe_json(s):
-        try:
-            return json.loads(s)
-        except Exception:
-            return None
-
     # Ensure out_dir exists
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    # --- Parsing loop ---
-    parsed = None
-    for _ in range(max_attempts):
-        if isinstance(raw_response, str):
-            parsed = safe_json(raw_response)
-            if not parsed:
-                fixed = raw_response.replace("\r", "").replace("\n", "\\n")
-                parsed = safe_json(fixed)
-        if isinstance(parsed, dict):
-            if "response" in parsed and isinstance(parsed["response"], str):
-                parsed = safe_json(parsed["response"]) or parsed
-            break
+    # --- Parse (single pass; the input doesn't change between attempts) ---
+    parsed = _parse_response(raw_response) if isinstance(raw_response, str) else None
+    if isinstance(parsed, dict) and isinstance(parsed.get("response"), str):
+        parsed = _parse_response(parsed["response"]) or parsed
 
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -96,12 +118,12 @@ def normalize_inference_output(raw_response: str, out_dir: Path, max_attempts: i
         # workflow
         wf_match = re.search(r'"workflow_yaml":\s*"([^"]+)"', raw_response, re.DOTALL)
         if wf_match:
-            parsed["workflow_yaml"] = wf_match.group(1).encode("utf-8").decode("unicode_escape")
+            parsed["workflow_yaml"] = _unescape(wf_match.group(1))
         # agents
         agent_matches = re.findall(r'"yaml":\s*"([^"]+)"', raw_response, re.DOTALL)
         if agent_matches:
             parsed["agents"] = [
-                {"yaml": b.encode("utf-8").decode("unicode_escape")} for b in agent_matches
+                {"yaml": _unescape(b)} for b in agent_matches
             ]
 
     # --- Save workflow.yaml ---
@@ -117,8 +139,9 @@ def normalize_inference_output(raw_response: str, out_dir: Path, max_attempts: i
         for agent in parsed["agents"]:
             canon = canonicalize_agent_yaml(agent)
             fname = out_dir / f"{canon['name']}.yaml"
-            with open(fname, "w") as f:
-                yaml.safe_dump(canon, f, sort_keys=False)
+            # Serialize once; the roles/ copy reuses the same text instead of re-reading the file
+            canon_text = fast_safe_dump(canon, sort_keys=False)
+            fname.write_text(canon_text)
             print(f"📝 Saved canonical agent YAML → {fname}")
             saved_agents.append(canon)
 
@@ -127,7 +150,7 @@ def normalize_inference_output(raw_response: str, out_dir: Path, max_attempts: i
                 roles_dir = Path("agents/roles")
                 roles_dir.mkdir(parents=True, exist_ok=True)
                 repo_path = roles_dir / f"{canon['name']}.yaml"
-                shutil.copy(fname, repo_path)
+                repo_path.write_text(canon_text)
                 print(f"📂 Copied role agent YAML → {repo_path}")
 
     # --- Post-process: Update Manager(s) with managed_agents ---
@@ -141,7 +164,7 @@ def normalize_inference_output(raw_response: str, out_dir: Path, max_attempts: i
             mgr_path = out_dir / f"{mgr['name']}.yaml"
             try:
                 with open(mgr_path) as f:
-                    mgr_yaml = yaml.safe_load(f)
+                    mgr_yaml = fast_safe_load(f)
 
                 mgr_yaml["managed_agents"] = [
                     {
@@ -154,7 +177,7 @@ def normalize_inference_output(raw_response: str, out_dir: Path, max_attempts: i
                 ]
 
                 with open(mgr_path, "w") as f:
-                    yaml.safe_dump(mgr_yaml, f, sort_keys=False)
+                    fast_safe_dump(mgr_yaml, f, sort_keys=False)
                 print(
                     f"🔗 Updated Manager {mgr['name']} with {len(roles)} managed_agents (canonical paths)"
                 )
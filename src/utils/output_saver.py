@@ -1,6 +1,7 @@
 # /src/utils/output_saver.py
-import os, json, yaml
+import os, json
 from datetime import datetime
+from src.utils.yaml_fast import fast_safe_dump
 from src.utils.response_parser import classify_and_normalize
 
 def save_output(base_dir: str, name: str, raw_response: dict):
@@ -20,13 +21,13 @@ def save_output(base_dir: str, name: str, raw_response: dict):
         # Save workflow.yaml
         wf_file = os.path.join(outdir, "workflow.yaml")
         with open(wf_file, "w") as f:
-            yaml.safe_dump(payload["workflow_yaml"], f, sort_keys=False)
+            fast_safe_dump(payload["workflow_yaml"], f, sort_keys=False)
 
         # Save each agent
         for i, agent in enumerate(payload.get("agents", []), 1):
             fname = f"agent_{i}_{agent.get('name','unnamed')}.yaml"
             with open(os.path.join(outdir, fname), "w") as f:
-                yaml.safe_dump(agent, f, sort_keys=False)
+                fast_safe_dump(agent, f, sort_keys=False)
 
         print(f"📂 Structured salvage written to {outdir}")
     else:
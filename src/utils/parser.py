@@ -1,10 +1,10 @@
-import yaml
+from src.utils.yaml_fast import fast_safe_load, fast_safe_dump
 import json
 from pathlib import Path
 
 def json_to_yaml(data: dict, output_file: str = None):
     """Convert JSON dict → YAML string (optionally save to file)."""
-    yaml_str = yaml.safe_dump(data, sort_keys=False)
+    yaml_str = fast_safe_dump(data, sort_keys=False)
     if output_file:
         Path(output_file).write_text(yaml_str, encoding="utf-8")
     return yaml_str
@@ -12,7 +12,7 @@ def json_to_yaml(data: dict, output_file: str = None):
 def yaml_to_json(yaml_file: str) -> dict:
     """Convert YAML file → JSON dict."""
     with open(yaml_file, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return fast_safe_load(f)
 
 def normalize_response(raw_text: str) -> dict:
     """
@@ -23,6 +23,6 @@ def normalize_response(raw_text: str) -> dict:
         return json.loads(raw_text)
     except json.JSONDecodeError:
         try:
-            return yaml.safe_load(raw_text)
+            return fast_safe_load(raw_text)
         except Exception as e:
             raise ValueError(f"Failed to parse response: {e}")
@@ -1,4 +1,5 @@
 import yaml
+from src.utils.yaml_fast import fast_safe_load
 from pathlib import Path
 
 def postprocess_yaml(input_path: Path, output_path: Path):
@@ -9,7 +10,7 @@ def postprocess_yaml(input_path: Path, output_path: Path):
     try:
         # Load parsed YAML
         with open(input_path, "r") as f:
-            data = yaml.safe_load(f)
+            data = fast_safe_load(f)
 
         if not isinstance(data, dict):
             raise ValueError("YAML is not a dict")
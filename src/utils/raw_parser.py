@@ -1,6 +1,6 @@
-import json
-import yaml
+from src.utils.yaml_fast import fast_safe_load
 from pathlib import Path
+from src.utils import json_fast
 
 def parse_raw_response(raw_path: str | Path) -> dict:
     """
@@ -9,13 +9,13 @@ def parse_raw_response(raw_path: str | Path) -> dict:
     - Inner 'response' JSON
     - Extracted YAMLs parsed to dicts
     """
-    raw = json.loads(Path(raw_path).read_text())
+    raw = json_fast.loads(Path(raw_path).read_bytes())
     output = {"outer": raw, "inner": None, "workflow_yaml": None, "agents": []}
 
     # Step 1: Parse inner response JSON if present
     if "response" in raw:
         try:
-            inner = json.loads(raw["response"])
+            inner = json_fast.loads(raw["response"])
             output["inner"] = inner
         except Exception as e:
             raise ValueError(f"Failed to parse inner response JSON: {e}")
@@ -23,7 +23,7 @@ def parse_raw_response(raw_path: str | Path) -> dict:
         # Step 2: Parse workflow YAML if available
         if "workflow_yaml" in inner:
             try:
-                output["workflow_yaml"] = yaml.safe_load(inner["workflow_yaml"])
+                output["workflow_yaml"] = fast_safe_load(inner["workflow_yaml"])
             except Exception as e:
                 print(f"⚠️ Could not parse workflow_yaml: {e}")
 
@@ -32,7 +32,7 @@ def parse_raw_response(raw_path: str | Path) -> dict:
             parsed_agent = dict(agent)  # shallow copy
             if "yaml" in agent:
                 try:
-                    parsed_agent["yaml_dict"] = yaml.safe_load(agent["yaml"])
+                    parsed_agent["yaml_dict"] = fast_safe_load(agent["yaml"])
                 except Exception as e:
                     print(f"⚠️ Could not parse agent YAML for {agent.get('name')}: {e}")
             output["agents"].append(parsed_agent)
@@ -1,20 +1,22 @@
 # /src/utils/response_parser.py
 import json
 import yaml
+from src.utils.yaml_fast import fast_safe_load
 from typing import Any, Dict, Tuple
+from src.utils import json_fast
 
 SUCCESS_KEYS = {"workflow_yaml", "agents"}
 
 def _try_json(s: str):
     try:
-        v = json.loads(s)
+        v = json_fast.loads(s)
         return True, v, "json_loads_success"
     except Exception as e:
         return False, None, f"json_loads_error:{type(e).__name__}"
 
 def _try_yaml(s: str):
     try:
-        v = yaml.safe_load(s)
+        v = fast_safe_load(s)
         return True, v, "yaml_load_success"
     except Exception as e:
         return False, None, f"yaml_load_error:{type(e).__name__}"
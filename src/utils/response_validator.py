@@ -1,6 +1,6 @@
 # src/utils/response_validator.py
 import json
-import yaml
+from src.utils.yaml_fast import fast_safe_load
 
 def is_valid_response(raw):
     """
@@ -26,7 +26,7 @@ def is_valid_response(raw):
         except Exception:
             pass
         try:
-            parsed = yaml.safe_load(raw)
+            parsed = fast_safe_load(raw)
             if isinstance(parsed, dict):
                 return True, parsed, None
         except Exception:
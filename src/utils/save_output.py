@@ -1,6 +1,7 @@
 # src/utils/save_output.py
 from pathlib import Path
 import yaml
+from src.utils.yaml_fast import fast_safe_dump
 
 def save_yaml_file(path, content):
     """Save string or dict as YAML file with pretty formatting."""
@@ -10,7 +11,7 @@ def save_yaml_file(path, content):
             f.write(content.strip() + "\n")
         else:
             # Dict → dump as YAML
-            yaml.safe_dump(content, f, sort_keys=False)
+            fast_safe_dump(content, f, sort_keys=False)
 
 def save_output(data, usecase_name: str, out_root="output"):
     domain = usecase_name.split("_")[-1] if "_" in usecase_name else usecase_name
@@ -1,26 +1,24 @@
-import yaml
+import re
 from pathlib import Path
+from src.utils.yaml_fast import fast_safe_dump
+
+# A newline followed by a top-level line (non-empty, not indented)
+_TOP_LEVEL_LINE_RE = re.compile(r"\n(?=[^ \n])")
 
 def save_structured_yaml(data: dict, out_path: Path):
     """Save YAML with blank lines between top-level keys for readability."""
     try:
-        raw_dump = yaml.safe_dump(
+        raw_dump = fast_safe_dump(
             data,
             sort_keys=False,
             default_flow_style=False
         )
 
         # Insert blank lines before each top-level key
-        formatted_lines = []
-        for i, line in enumerate(raw_dump.splitlines()):
-            if line and not line.startswith(" ") and i > 0:
-                formatted_lines.append("")
-            formatted_lines.append(line)
-        formatted = "\n".join(formatted_lines)
+        formatted = _TOP_LEVEL_LINE_RE.sub("\n\n", raw_dump.removesuffix("\n"))
 
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(out_path, "w") as f:
-            f.write(formatted)
+        out_path.write_bytes(formatted.encode("utf-8"))
 
         print(f"✅ Saved structured YAML → {out_path}")
     except Exception as e:
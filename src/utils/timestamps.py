@@ -0,0 +1,45 @@
+# src/utils/timestamps.py
+# Timestamp / id-suffix / agent-name helpers shared by the agent rename paths
+# (scripts/create_manager_with_roles.py, src/api/client_async.py, backend/main_with_auth.py).
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, tzinfo
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+DEFAULT_TZ_NAME = "America/Los_Angeles"
+
+_MONTHS = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+
+
+@lru_cache(maxsize=64)
+def resolve_tz(tz_name: str | None = None) -> ZoneInfo:
+    """ZoneInfo for tz_name (APP_TZ when omitted); unknown names fall back to America/Los_Angeles."""
+    tz_name = tz_name or os.getenv("APP_TZ", DEFAULT_TZ_NAME)
+    try:
+        return ZoneInfo(tz_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo(DEFAULT_TZ_NAME)
+
+
+def timestamp_str(tz: tzinfo | None = None) -> str:
+    """Current time as e.g. 16OCT2026-02:54AM PDT (in APP_TZ unless tz is given)."""
+    now = datetime.now(tz or resolve_tz())
+    # Hand-formatted rather than strftime("%d%b%Y-%I:%M%p %Z"): %b/%p follow the
+    # process locale, the stamp must not. tzname() is per call so DST flips are kept.
+    hour = now.hour % 12 or 12
+    ampm = "AM" if now.hour < 12 else "PM"
+    return f"{now.day:02d}{_MONTHS[now.month - 1]}{now.year}-{hour:02d}:{now.minute:02d}{ampm} {(now.tzname() or '').upper()}"
+
+
+def suffix_from_id(agent_id: str | None) -> str:
+    """Last 6 chars of an agent id, or XXXXXX when there is none."""
+    return agent_id[-6:] if agent_id else "XXXXXX"
+
+
+def rich_manager_name(base: str, ts: str, agent_id: str | None = None) -> str:
+    """<base>_v1.0[_<id suffix>]_<ts>; the suffix is only added when the id is known."""
+    suffix = f"_{suffix_from_id(agent_id)}" if agent_id else ""
+    return f"{base}_v1.0{suffix}_{ts}"
@@ -1,8 +1,7 @@
 # src/utils/versioning.py
 
 import re
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
 from tzlocal import get_localzone
 from typing import List, Dict, Optional
 
@@ -10,7 +9,7 @@ from typing import List, Dict, Optional
 try:
     LOCAL_TZ = get_localzone()
 except Exception:
-    LOCAL_TZ = pytz.UTC
+    LOCAL_TZ = timezone.utc
 
 
 def extract_base_name(agent_name: str) -> str:
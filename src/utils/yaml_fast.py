@@ -0,0 +1,23 @@
+# src/utils/yaml_fast.py
+# LibYAML-backed (C) safe loading/dumping, falling back to PyYAML's pure-Python SafeLoader/SafeDumper.
+
+import logging
+import yaml
+
+logger = logging.getLogger("yaml-fast")
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    logger.warning("⚠️ libyaml not available — YAML parsing falls back to the pure-Python SafeLoader")
+
+
+def fast_safe_load(stream):
+    """Drop-in for yaml.safe_load (str, bytes or file object) using the C loader when available."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def fast_safe_dump(data, stream=None, **kwargs):
+    """Drop-in for yaml.safe_dump using the C dumper when available."""
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
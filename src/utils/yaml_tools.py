@@ -1,8 +1,8 @@
-import yaml
+from src.utils.yaml_fast import fast_safe_load
 
 def validate_yaml_schema(yaml_def: str) -> dict:
     try:
-        parsed = yaml.safe_load(yaml_def)
+        parsed = fast_safe_load(yaml_def)
         # basic check for required keys
         required = ["name", "agent_role", "agent_goal"]
         for key in required:
@@ -1,5 +1,6 @@
 # /src/utils/yaml_utils.py
 import yaml
+from src.utils.yaml_fast import fast_safe_load
 from pathlib import Path
 import re
 
@@ -24,7 +25,7 @@ def save_yaml_file(path: Path, yaml_str: str) -> None:
     """
     path.parent.mkdir(parents=True, exist_ok=True)
     try:
-        parsed = yaml.safe_load(yaml_str)
+        parsed = fast_safe_load(yaml_str)
         with open(path, "w") as f:
             yaml.dump(
                 parsed,
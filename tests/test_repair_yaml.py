@@ -0,0 +1,42 @@
+import os
+import re
+import sys
+
+# Make sure repo root is in path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from process_hr_yaml import repair_yaml, parse_repaired_yaml
+
+# Previous per-key loop, kept as the reference behaviour
+def _repair_yaml_loop(text: str) -> str:
+    keys = [
+        "name:", "description:", "agent_role:", "agent_goal:", "agent_instructions:",
+        "examples:", "features:", "tools:", "response_format:", "provider_id:",
+        "model:", "temperature:", "top_p:", "structured_output_examples:",
+        "managed_agents:", "tool_usage_description:", "tools:"
+    ]
+    for key in keys:
+        text = re.sub(rf"(?<!\n){key}", f"\n{key}", text)
+    return text
+
+def test_repair_yaml_matches_loop():
+    squashed = (
+        "name: HR_Agent description: Screens candidates agent_role: Recruiter "
+        "agent_goal: Shortlist agent_instructions: Be fair\nfeatures: [] tools: [] "
+        "response_format: {type: json} provider_id: OpenAI model: gpt-4o-mini "
+        "temperature: 0.3 top_p: 0.9 managed_agents: []"
+    )
+    assert repair_yaml(squashed) == _repair_yaml_loop(squashed)
+
+def test_repair_yaml_keeps_compound_keys_whole():
+    # The loop split these on their `description:` / `examples:` suffix
+    text = "tool_usage_description: x structured_output_examples: []"
+    assert repair_yaml(text) == "\ntool_usage_description: x \nstructured_output_examples: []"
+
+def test_repair_yaml_empty():
+    assert repair_yaml("") == ""
+
+def test_parse_repaired_yaml_json_fast_path():
+    # JSON input is parsed as-is; repair_yaml would have split "name:" inside the string
+    text = '{"name": "HR_Agent", "description": "name: inside a value", "tools": []}'
+    assert parse_repaired_yaml(text) == {"name": "HR_Agent", "description": "name: inside a value", "tools": []}